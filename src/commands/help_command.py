@@ -1,6 +1,6 @@
 """Help command implementation with enhanced formatting and categorization."""
 
-from typing import Dict, List, Optional
+from typing import List, Optional
 import discord
 
 from core.base_command import BaseCommand
@@ -50,13 +50,11 @@ class HelpCommand(BaseCommand):
                 metadata={
                     "response_length": len(help_response),
                     "specific_command": args[0] if args else None,
-                    "total_commands": len(
-                        await self.command_registry.get_all_commands()
-                    ),
+                    "total_commands": len(self.command_registry.get_all_commands()),
                 },
             )
         except Exception as error:
-            self.logger.error(f"Failed to generate help response: {error}")
+            self.logger.error("Failed to generate help response: %s", error)
             raise CommandError(
                 f"Failed to generate help: {error}",
                 command_name=self.name,
@@ -64,10 +62,10 @@ class HelpCommand(BaseCommand):
             ) from error
 
     async def _build_general_help(self) -> str:
-        commands = await self.command_registry.get_all_commands()
+        commands = self.command_registry.get_all_commands()
         if not commands:
             return "❌ No commands available"
-        categorized_commands = await self._categorize_commands(commands)
+        categorized_commands = self.command_registry.get_categorized()
         sections: List[str] = []
         total_commands = len(commands)
         enabled_commands = len([cmd for cmd in commands if cmd.get_config().enabled])
@@ -125,7 +123,7 @@ class HelpCommand(BaseCommand):
         if config.permissions:
             sections.append(f"• Permissions: {', '.join(config.permissions)}")
         sections.append("")
-        category = self._categorize_single_command(command)
+        category = self.command_registry.get_category(command.name)
         sections.append(
             f"**Category**: {self._get_category_emoji(category)} {category}"
         )
@@ -133,40 +131,6 @@ class HelpCommand(BaseCommand):
         sections.append("💡 **Tip**: Use `.help` to see all commands")
         return "\n".join(sections)
 
-    async def _categorize_commands(
-        self, commands: List[ICommand]
-    ) -> Dict[str, List[ICommand]]:
-        categories: Dict[str, List[ICommand]] = {
-            "Utility": [],
-            "Fun": [],
-            "Information": [],
-            "Moderation": [],
-            "Other": [],
-        }
-        for command in commands:
-            category = self._categorize_single_command(command)
-            if category in categories:
-                categories[category].append(command)
-            else:
-                categories["Other"].append(command)
-        return {k: v for k, v in categories.items() if v}
-
-    def _categorize_single_command(self, command: ICommand) -> str:
-        name_lower = command.name.lower()
-        utility_commands = {"ping", "help", "status", "info", "stats", "uptime"}
-        if name_lower in utility_commands:
-            return "Utility"
-        fun_commands = {"hurt", "owo", "meow", "hentai", "joke", "meme", "ascii"}
-        if name_lower in fun_commands:
-            return "Fun"
-        info_commands = {"user", "server", "channel", "role", "avatar", "whois"}
-        if name_lower in info_commands:
-            return "Information"
-        mod_commands = {"ban", "kick", "mute", "warn", "clear", "purge"}
-        if name_lower in mod_commands:
-            return "Moderation"
-        return "Other"
-
     def _get_category_emoji(self, category: str) -> str:
         category_emojis = {
             "Utility": "🔧",
@@ -182,16 +146,12 @@ class HelpCommand(BaseCommand):
 
     async def _find_command(self, identifier: str) -> Optional[ICommand]:
         if identifier.startswith("."):
-            return await self.command_registry.get_command(identifier)
-        trigger_with_dot = f".{identifier}"
-        command = await self.command_registry.get_command(trigger_with_dot)
-        if command:
-            return command
-        commands = await self.command_registry.get_all_commands()
-        for command in commands:
-            if command.name.lower() == identifier.lower():
-                return command
-        return None
+            return self.command_registry.get_command(identifier)
+        registry = self.command_registry
+        return (
+            registry.get_command(f".{identifier}")
+            or registry.get_command_by_name(identifier, ignore_case=True)
+        )
 
     def _parse_arguments(self, content: str) -> List[str]:
         args_text = content[len(self.trigger) :].strip()
@@ -52,7 +52,7 @@ class PingCommand(BaseCommand):
                 },
             )
         except Exception as error:
-            self.logger.error(f"Failed to execute ping command: {error}")
+            self.logger.error("Failed to execute ping command: %s", error)
             raise CommandError(
                 f"Failed to measure latency: {error}",
                 command_name=self.name,
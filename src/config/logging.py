@@ -36,9 +36,9 @@ def setup_logging(settings: Optional[Settings] = None) -> None:
 
     # Log startup information
     logger = logging.getLogger("discord_selfbot.config")
-    logger.info(f"Logging configured with level: {log_level}")
-    logger.info(f"Environment: {settings.environment}")
-    logger.info(f"Debug mode: {settings.debug}")
+    logger.info("Logging configured with level: %s", log_level)
+    logger.info("Environment: %s", settings.environment)
+    logger.info("Debug mode: %s", settings.debug)
 
     if settings.is_production:
         logger.warning("Running in PRODUCTION mode")
@@ -182,29 +182,33 @@ class StructuredLogger:
         """Clear all context information."""
         self.context.clear()
 
+    def isEnabledFor(self, level: int) -> bool:
+        """Check whether messages at the given level would be emitted."""
+        return self.logger.isEnabledFor(level)
+
     def _format_message(self, message: str, **kwargs: Any) -> str:
         return message
 
-    def debug(self, message: str, **kwargs: Any) -> None:
+    def debug(self, message: str, *args: Any, **kwargs: Any) -> None:
         """Log debug message with metadata."""
-        self.logger.debug(message, extra={**self.context, **kwargs})
+        self.logger.debug(message, *args, extra={**self.context, **kwargs})
 
-    def info(self, message: str, **kwargs: Any) -> None:
+    def info(self, message: str, *args: Any, **kwargs: Any) -> None:
         """Log info message with metadata."""
-        self.logger.info(message, extra={**self.context, **kwargs})
+        self.logger.info(message, *args, extra={**self.context, **kwargs})
 
-    def warning(self, message: str, **kwargs: Any) -> None:
+    def warning(self, message: str, *args: Any, **kwargs: Any) -> None:
         """Log warning message with metadata."""
-        self.logger.warning(message, extra={**self.context, **kwargs})
+        self.logger.warning(message, *args, extra={**self.context, **kwargs})
 
-    def error(self, message: str, **kwargs: Any) -> None:
+    def error(self, message: str, *args: Any, **kwargs: Any) -> None:
         """Log error message with metadata."""
-        self.logger.error(message, extra={**self.context, **kwargs})
+        self.logger.error(message, *args, extra={**self.context, **kwargs})
 
-    def critical(self, message: str, **kwargs: Any) -> None:
+    def critical(self, message: str, *args: Any, **kwargs: Any) -> None:
         """Log critical message with metadata."""
-        self.logger.critical(message, extra={**self.context, **kwargs})
+        self.logger.critical(message, *args, extra={**self.context, **kwargs})
 
-    def exception(self, message: str, **kwargs: Any) -> None:
+    def exception(self, message: str, *args: Any, **kwargs: Any) -> None:
         """Log exception message with metadata and traceback."""
-        self.logger.exception(message, extra={**self.context, **kwargs})
+        self.logger.exception(message, *args, extra={**self.context, **kwargs})
@@ -1,5 +1,5 @@
 import os
-from functools import lru_cache
+from functools import cache
 from typing import List, Optional
 
 from pydantic import Field, validator
@@ -174,7 +174,7 @@ class Settings(BaseSettings):
             )
 
 
-@lru_cache()
+@cache
 def get_settings() -> Settings:
     try:
         settings = Settings()
@@ -5,6 +5,9 @@ from .types import (
     CommandConfig,
     BotStats,
     ConnectionStatus,
+    CONNECTION_STATUS_NAMES,
+    COMMAND_CATEGORIES,
+    COMMAND_CATEGORY_OF_NAME,
 )
 from .exceptions import (
     DiscordSelfBotError,
@@ -24,6 +27,9 @@ __all__ = [
     "CommandConfig",
     "BotStats",
     "ConnectionStatus",
+    "CONNECTION_STATUS_NAMES",
+    "COMMAND_CATEGORIES",
+    "COMMAND_CATEGORY_OF_NAME",
     "DiscordSelfBotError",
     "CommandError",
     "ConfigurationError",
@@ -18,7 +18,7 @@ class BaseCommand(ABC, ICommand):
         self.logger = logging.getLogger(f"commands.{command_name}")
         self._last_execution: Dict[str, float] = {}
         self._execution_lock = asyncio.Lock()
-        self.logger.debug(f"Initialized command: {command_name}")
+        self.logger.debug("Initialized command: %s", command_name)
 
     @property
     @abstractmethod
@@ -35,6 +35,10 @@ class BaseCommand(ABC, ICommand):
     def trigger(self) -> str:
         ...
 
+    def get_config(self) -> CommandConfig:
+        """Return the live command configuration."""
+        return self.config
+
     async def execute(self, message: discord.Message) -> CommandExecutionResult:
         """
         Execute the command with error handling and logging.
@@ -58,7 +62,7 @@ class BaseCommand(ABC, ICommand):
         try:
             # Check if command is enabled
             if not self.config.enabled:
-                self.logger.warning(f"Command {self.name} is disabled")
+                self.logger.warning("Command %s is disabled", self.name)
                 return CommandExecutionResult(
                     success=False,
                     error="Command is currently disabled",
@@ -71,8 +75,10 @@ class BaseCommand(ABC, ICommand):
                     message.author.id
                 )
                 self.logger.debug(
-                    f"Command {self.name} on cooldown for user {message.author.id}, "
-                    f"{cooldown_remaining:.1f}s remaining"
+                    "Command %s on cooldown for user %s, %.1fs remaining",
+                    self.name,
+                    message.author.id,
+                    cooldown_remaining,
                 )
                 return CommandExecutionResult(
                     success=False,
@@ -88,7 +94,7 @@ class BaseCommand(ABC, ICommand):
                     error_code="INVALID_MESSAGE",
                 )
 
-            self.logger.debug(f"Executing command: {self.name}")
+            self.logger.debug("Executing command: %s", self.name)
 
             # Execute the actual command logic
             result = await self.execute_command(message)
@@ -107,15 +113,16 @@ class BaseCommand(ABC, ICommand):
             result.metadata["user_id"] = str(message.author.id)
 
             self.logger.debug(
-                f"Command {self.name} executed successfully in "
-                f"{result.response_time:.2f}ms"
+                "Command %s executed successfully in %.2fms",
+                self.name,
+                result.response_time,
             )
 
             return result
 
         except Exception as error:
             response_time = (time.time() - start_time) * 1000
-            self.logger.error(f"Failed to execute command {self.name}: {error}")
+            self.logger.error("Failed to execute command %s: %s", self.name, error)
 
             # Try to send error message to user
             await self._handle_error(message, error)
@@ -34,7 +34,7 @@ class EventLoopManager:
             cls._uvloop_available = False
             return False
         except Exception as e:
-            logger.warning(f"uvloop available but incompatible: {e}")
+            logger.warning("uvloop available but incompatible: %s", e)
             cls._uvloop_available = False
             return False
 
@@ -57,7 +57,7 @@ class EventLoopManager:
                 return "uvloop"
             except Exception as e:
                 logger.warning(
-                    f"Failed to install uvloop: {e}, falling back to asyncio"
+                    "Failed to install uvloop: %s, falling back to asyncio", e
                 )
 
         logger.info("Using standard asyncio event loop")
@@ -94,7 +94,7 @@ class EventLoopManager:
 
                 return uvloop.new_event_loop()
             except Exception as e:
-                logger.warning(f"Failed to create uvloop: {e}")
+                logger.warning("Failed to create uvloop: %s", e)
 
         return asyncio.new_event_loop()
 
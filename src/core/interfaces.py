@@ -1,6 +1,6 @@
-from typing import List, Optional, Protocol, runtime_checkable
+from typing import List, Mapping, Optional, Protocol, Tuple, runtime_checkable
 import discord
-from .types import CommandExecutionResult
+from .types import CommandConfig, CommandExecutionResult
 
 
 @runtime_checkable
@@ -11,15 +11,24 @@ class ICommand(Protocol):
     def description(self) -> str: ...
     @property
     def trigger(self) -> str: ...
+    def get_config(self) -> CommandConfig: ...
     async def execute(self, message: discord.Message) -> CommandExecutionResult: ...
 
 
 @runtime_checkable
 class ICommandRegistry(Protocol):
+    # Empty so implementations that declare __slots__ get no instance __dict__
+    __slots__ = ()
+
     async def register(self, command: ICommand) -> None: ...
-    async def get_command(self, trigger: str) -> Optional[ICommand]: ...
-    async def get_all_commands(self) -> List[ICommand]: ...
-    async def has_command(self, trigger: str) -> bool: ...
+    def get_command(self, trigger: str) -> Optional[ICommand]: ...
+    def get_command_by_name(
+        self, name: str, ignore_case: bool = False
+    ) -> Optional[ICommand]: ...
+    def get_all_commands(self) -> List[ICommand]: ...
+    def get_category(self, name: str) -> str: ...
+    def get_categorized(self) -> Mapping[str, Tuple[ICommand, ...]]: ...
+    def has_command(self, trigger: str) -> bool: ...
     async def unregister(self, trigger: str) -> bool: ...
     async def clear(self) -> None: ...
 
@@ -29,8 +38,8 @@ class IBotStats(Protocol):
     async def increment_commands_executed(self) -> None: ...
     async def increment_messages_processed(self) -> None: ...
     async def update_last_activity(self) -> None: ...
-    async def get_uptime(self) -> float: ...
-    async def get_ping(self) -> float: ...
+    def get_uptime(self) -> float: ...
+    def get_ping(self) -> float: ...
 
 
 @runtime_checkable
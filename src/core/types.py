@@ -1,15 +1,43 @@
+import sys
 from dataclasses import dataclass, field
 from datetime import datetime
-from enum import Enum
+from enum import IntEnum
 from typing import Any, Dict, List, Optional
 
-
-class ConnectionStatus(Enum):
-    DISCONNECTED = "disconnected"
-    CONNECTING = "connecting"
-    CONNECTED = "connected"
-    RECONNECTING = "reconnecting"
-    ERROR = "error"
+# dataclass(slots=True) is only available on Python 3.10+
+_SLOTS: Dict[str, bool] = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
+class ConnectionStatus(IntEnum):
+    DISCONNECTED = 0
+    CONNECTING = 1
+    CONNECTED = 2
+    RECONNECTING = 3
+    ERROR = 4
+
+
+# Status names indexed by ConnectionStatus value
+CONNECTION_STATUS_NAMES = (
+    "disconnected",
+    "connecting",
+    "connected",
+    "reconnecting",
+    "error",
+)
+
+# Command categories in display order, and the category of each known
+# command name; unlisted names fall under "Other"
+COMMAND_CATEGORIES = ("Utility", "Fun", "Information", "Moderation", "Other")
+COMMAND_CATEGORY_OF_NAME: Dict[str, str] = {
+    name: category
+    for category, names in {
+        "Utility": ("ping", "help", "status", "info", "stats", "uptime"),
+        "Fun": ("hurt", "owo", "meow", "hentai", "joke", "meme", "ascii"),
+        "Information": ("user", "server", "channel", "role", "avatar", "whois"),
+        "Moderation": ("ban", "kick", "mute", "warn", "clear", "purge"),
+    }.items()
+    for name in names
+}
 
 
 @dataclass
@@ -64,6 +92,13 @@ class BotStats:
         if self.messages_processed < 0:
             raise ValueError("Messages processed must be non-negative")
 
+    @classmethod
+    def _unchecked(cls, **fields: Any) -> "BotStats":
+        """Build from already-valid values without running __post_init__."""
+        stats = object.__new__(cls)
+        stats.__dict__.update(memory_usage=None, cpu_usage=None, **fields)
+        return stats
+
 
 @dataclass
 class TokenInfo:
@@ -81,7 +116,7 @@ class TokenInfo:
             self.token = f"{self.token[:6]}...{self.token[-4:]}"
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class CommandMetrics:
     command_name: str
     execution_count: int = 0
@@ -92,16 +127,28 @@ class CommandMetrics:
     success_count: int = 0
     error_count: int = 0
     last_executed: Optional[datetime] = None
+    # Lazily formatted copy of last_executed, invalidated on every update
+    last_executed_iso: Optional[str] = field(default=None, repr=False, compare=False)
 
     def update_metrics(self, execution_time: float, success: bool) -> None:
-        self.execution_count += 1
-        self.total_execution_time += execution_time
-        self.average_execution_time = self.total_execution_time / self.execution_count
-        self.min_execution_time = min(self.min_execution_time, execution_time)
-        self.max_execution_time = max(self.max_execution_time, execution_time)
+        count = self.execution_count + 1
+        total = self.total_execution_time + execution_time
+        self.execution_count = count
+        self.total_execution_time = total
+        self.average_execution_time = total / count
+        if execution_time < self.min_execution_time:
+            self.min_execution_time = execution_time
+        if execution_time > self.max_execution_time:
+            self.max_execution_time = execution_time
         self.last_executed = datetime.now()
+        self.last_executed_iso = None
 
         if success:
             self.success_count += 1
         else:
             self.error_count += 1
+
+    def get_last_executed_iso(self) -> Optional[str]:
+        if self.last_executed_iso is None and self.last_executed is not None:
+            self.last_executed_iso = self.last_executed.isoformat()
+        return self.last_executed_iso
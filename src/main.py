@@ -27,13 +27,13 @@ class DiscordSelfBot:
         self.discord_service: Optional[DiscordService] = None
         self.bot_stats: Optional[BotStatsService] = None
         self._shutdown_event = asyncio.Event()
-        self._setup_signal_handlers()
         self.logger.info("Discord self-bot application initialized")
 
     async def start(self) -> None:
         """Start the Discord self-bot application."""
         try:
             self.logger.info("🚀 Starting Discord self-bot...")
+            self._setup_signal_handlers()
             await self._display_startup_info()
             await self._initialize_services()
             await self._register_commands()
@@ -42,7 +42,7 @@ class DiscordSelfBot:
             await self.discord_service.start()
 
         except Exception as e:
-            self.logger.error(f"❌ Failed to start Discord self-bot: {e}")
+            self.logger.error("❌ Failed to start Discord self-bot: %s", e)
             await self._cleanup()
             raise DiscordSelfBotError(
                 f"Application startup failed: {e}", error_code="STARTUP_FAILED"
@@ -61,7 +61,7 @@ class DiscordSelfBot:
             self.logger.info("✅ Discord self-bot stopped successfully")
 
         except Exception as e:
-            self.logger.error(f"❌ Error during shutdown: {e}")
+            self.logger.error("❌ Error during shutdown: %s", e)
             raise
 
     async def _initialize_services(self) -> None:
@@ -94,7 +94,8 @@ class DiscordSelfBot:
             # Get registration statistics
             stats = await self.command_registry.get_stats()
             self.logger.info(
-                f"✅ Registered {stats['total_commands']} commands successfully",
+                "✅ Registered %d commands successfully",
+                stats["total_commands"],
                 extra={
                     "total_commands": stats["total_commands"],
                     "enabled_commands": stats["enabled_commands"],
@@ -102,17 +103,18 @@ class DiscordSelfBot:
             )
 
         except Exception as e:
-            self.logger.error(f"❌ Failed to register commands: {e}")
+            self.logger.error("❌ Failed to register commands: %s", e)
             raise
 
     async def _display_startup_info(self) -> None:
         """Display startup information and warnings."""
+        settings = self.settings
         self.logger.info("=" * 60)
         self.logger.info("🤖 Discord Self-Bot Python Implementation")
         self.logger.info("=" * 60)
-        self.logger.info(f"📊 Environment: {self.settings.environment}")
-        self.logger.info(f"🐛 Debug Mode: {self.settings.debug}")
-        self.logger.info(f"📝 Log Level: {self.settings.get_effective_log_level()}")
+        self.logger.info("📊 Environment: %s", settings.environment)
+        self.logger.info("🐛 Debug Mode: %s", settings.debug)
+        self.logger.info("📝 Log Level: %s", settings.get_effective_log_level())
 
         # Display async performance info
         perf_info = get_async_performance_info()
@@ -143,31 +145,25 @@ class DiscordSelfBot:
             self.logger.debug("Cleanup completed successfully")
 
         except Exception as e:
-            self.logger.error(f"Error during cleanup: {e}")
+            self.logger.error("Error during cleanup: %s", e)
 
     def _setup_signal_handlers(self) -> None:
-        """Setup signal handlers for graceful shutdown."""
+        """Setup signal handlers for graceful shutdown on the running loop."""
+        if sys.platform == "win32":
+            return
 
-        def signal_handler(signum, frame):
-            """Handle shutdown signals."""
-            signal_name = signal.Signals(signum).name
-            self.logger.info(f"Received {signal_name}, initiating graceful shutdown...")
+        loop = asyncio.get_running_loop()
+        for signum in (signal.SIGINT, signal.SIGTERM):
+            loop.add_signal_handler(signum, self._handle_signal, signum)
 
-            # Set shutdown event
-            if not self._shutdown_event.is_set():
-                self._shutdown_event.set()
+    def _handle_signal(self, signum: int) -> None:
+        """Handle shutdown signals."""
+        signal_name = signal.Signals(signum).name
+        self.logger.info("Received %s, initiating graceful shutdown...", signal_name)
 
-                # Schedule shutdown coroutine
-                loop = asyncio.get_event_loop()
-                if loop.is_running():
-                    loop.create_task(self.stop())
-                else:
-                    asyncio.run(self.stop())
-
-        # Register signal handlers
-        if sys.platform != "win32":
-            signal.signal(signal.SIGINT, signal_handler)
-            signal.signal(signal.SIGTERM, signal_handler)
+        if not self._shutdown_event.is_set():
+            self._shutdown_event.set()
+            asyncio.get_running_loop().create_task(self.stop())
 
     @property
     def is_running(self) -> bool:
@@ -178,6 +174,10 @@ class DiscordSelfBot:
             and not self._shutdown_event.is_set()
         )
 
+    async def wait_closed(self) -> None:
+        """Wait until a shutdown of the application has been requested."""
+        await self._shutdown_event.wait()
+
     async def get_status(self) -> dict:
         """
         Get the current application status.
@@ -217,8 +217,7 @@ async def main() -> None:
         await bot.start()
 
         # Keep the application running until shutdown
-        while bot.is_running:
-            await asyncio.sleep(1)
+        await bot.wait_closed()
 
     except ConfigurationError as e:
         print(f"❌ Configuration Error: {e}")
@@ -1,12 +1,19 @@
 # Bot statistics service for Discord self-bot.
 import asyncio
+import sys
+import time
 from datetime import datetime
 from typing import Dict, Optional
 
 import discord
 
 from core.interfaces import IBotStats
-from core.types import BotStats, ConnectionStatus, CommandMetrics
+from core.types import (
+    BotStats,
+    CONNECTION_STATUS_NAMES,
+    ConnectionStatus,
+    CommandMetrics,
+)
 from config.logging import StructuredLogger
 
 
@@ -17,67 +24,58 @@ class BotStatsService(IBotStats):
 
         # Core statistics
         self.start_time = datetime.now()
+        self._start_time_iso = self.start_time.isoformat()
+        self._start_monotonic = time.monotonic()
         self.commands_executed = 0
         self.messages_processed = 0
         self.last_activity = datetime.now()
         self.current_status = ConnectionStatus.DISCONNECTED
+        # Set once the client is ready, so get_ping can skip hasattr per call
+        self._ws_latency_ok = False
 
         # Performance metrics
         self.command_metrics: Dict[str, CommandMetrics] = {}
 
+        # Running aggregates, maintained by record_command_execution
+        self._total_exec_time = 0.0
+        self._total_exec_count = 0
+        self._total_success = 0
+        self._most_used_name: Optional[str] = None
+        self._most_used_count = 0
+
         # Thread safety
         self._lock = asyncio.Lock()
 
-        # Setup event listeners
-        self._setup_event_listeners()
-
         self.logger.info("Bot statistics service initialized")
 
-    def _setup_event_listeners(self) -> None:
-        """Setup event listeners to track bot activity."""
-
-        @self.client.event
-        async def on_ready():
-            """Handle client ready event."""
-            await self._update_status(ConnectionStatus.CONNECTED)
-            await self.update_last_activity()
-            self.logger.info(
-                f"Bot connected as {self.client.user}",
-                user_id=str(self.client.user.id) if self.client.user else None,
-                username=str(self.client.user) if self.client.user else None,
-            )
+    # Client event hooks, invoked inline from DiscordService's event handlers
+
+    async def on_ready(self) -> None:
+        """Track the client becoming ready."""
+        self._ws_latency_ok = hasattr(self.client.ws, "latency")
+        await self._update_status(ConnectionStatus.CONNECTED)
+        await self.update_last_activity()
+
+    async def on_disconnect(self) -> None:
+        """Track the client disconnecting."""
+        await self._update_status(ConnectionStatus.DISCONNECTED)
+        await self.update_last_activity()
 
-        @self.client.event
-        async def on_disconnect():
-            """Handle client disconnect event."""
-            await self._update_status(ConnectionStatus.DISCONNECTED)
-            await self.update_last_activity()
-            self.logger.warning("Bot disconnected from Discord")
-
-        @self.client.event
-        async def on_resumed():
-            """Handle client resume event."""
-            await self._update_status(ConnectionStatus.CONNECTED)
-            await self.update_last_activity()
-            self.logger.info("Bot connection resumed")
-
-        @self.client.event
-        async def on_error(event, *args, **kwargs):
-            """Handle client error event."""
-            await self._update_status(ConnectionStatus.ERROR)
-            await self.update_last_activity()
-            self.logger.error(f"Discord client error in {event}", event=event)
-
-        @self.client.event
-        async def on_message(message):
-            """Handle message event."""
-            await self.increment_messages_processed()
+    async def on_resumed(self) -> None:
+        """Track the client resuming its session."""
+        await self._update_status(ConnectionStatus.CONNECTED)
+        await self.update_last_activity()
+
+    async def on_error(self, event: str) -> None:
+        """Track a client error."""
+        await self._update_status(ConnectionStatus.ERROR)
+        await self.update_last_activity()
 
     async def increment_commands_executed(self) -> None:
         """Increment the count of executed commands."""
         async with self._lock:
             self.commands_executed += 1
-            await self.update_last_activity()
+            self.last_activity = datetime.now()
 
             self.logger.debug("Command executed", total_commands=self.commands_executed)
 
@@ -85,52 +83,68 @@ class BotStatsService(IBotStats):
         """Increment the count of processed messages."""
         async with self._lock:
             self.messages_processed += 1
-            await self.update_last_activity()
+            self.last_activity = datetime.now()
+
+    async def record_message_and_command(
+        self, command_name: str, execution_time: float, success: bool
+    ) -> None:
+        """
+        Record a processed message together with the command it ran.
+
+        Args:
+            command_name: Name of the executed command
+            execution_time: Time taken for execution in milliseconds
+            success: Whether the execution was successful
+        """
+        command_name = sys.intern(command_name)
+        async with self._lock:
+            self.messages_processed += 1
+            self.commands_executed += 1
+            self.last_activity = datetime.now()
+            self._record_command(command_name, execution_time, success)
 
     async def update_last_activity(self) -> None:
         """Update the timestamp of last activity."""
         async with self._lock:
             self.last_activity = datetime.now()
 
-    async def get_uptime(self) -> float:
+    def get_uptime(self) -> float:
         """
         Get the bot uptime in milliseconds.
 
         Returns:
             Uptime in milliseconds
         """
-        current_time = datetime.now()
-        uptime_delta = current_time - self.start_time
-        return uptime_delta.total_seconds() * 1000
+        return (time.monotonic() - self._start_monotonic) * 1000
 
-    async def get_ping(self) -> float:
+    def get_ping(self) -> float:
         """
         Get the current WebSocket ping.
 
         Returns:
             Ping in milliseconds
         """
-        if self.client.ws and hasattr(self.client.ws, "latency"):
-            return self.client.ws.latency * 1000
+        ws = self.client.ws
+        if ws and self._ws_latency_ok:
+            return ws.latency * 1000
         return 0.0
 
-    async def get_stats(self) -> BotStats:
+    def get_stats(self) -> BotStats:
         """
         Get comprehensive bot statistics.
 
         Returns:
             BotStats object with current statistics
         """
-        async with self._lock:
-            return BotStats(
-                status=self.current_status,
-                ping=await self.get_ping(),
-                uptime=await self.get_uptime(),
-                commands_executed=self.commands_executed,
-                messages_processed=self.messages_processed,
-                last_activity=self.last_activity,
-                start_time=self.start_time,
-            )
+        return BotStats._unchecked(
+            status=self.current_status,
+            ping=self.get_ping(),
+            uptime=self.get_uptime(),
+            commands_executed=self.commands_executed,
+            messages_processed=self.messages_processed,
+            last_activity=self.last_activity,
+            start_time=self.start_time,
+        )
 
     async def record_command_execution(
         self, command_name: str, execution_time: float, success: bool
@@ -143,20 +157,36 @@ class BotStatsService(IBotStats):
             execution_time: Time taken for execution in milliseconds
             success: Whether the execution was successful
         """
+        command_name = sys.intern(command_name)
         async with self._lock:
-            if command_name not in self.command_metrics:
-                self.command_metrics[command_name] = CommandMetrics(
-                    command_name=command_name
-                )
-
-            self.command_metrics[command_name].update_metrics(execution_time, success)
+            self._record_command(command_name, execution_time, success)
 
-            self.logger.debug(
-                f"Recorded metrics for command {command_name}",
-                command_name=command_name,
-                execution_time=execution_time,
-                success=success,
+    def _record_command(
+        self, command_name: str, execution_time: float, success: bool
+    ) -> None:
+        """Update per-command metrics and running aggregates (caller holds the lock)."""
+        metrics = self.command_metrics.get(command_name)
+        if metrics is None:
+            metrics = self.command_metrics[command_name] = CommandMetrics(
+                command_name=command_name
             )
+        metrics.update_metrics(execution_time, success)
+
+        self._total_exec_time += execution_time
+        self._total_exec_count += 1
+        if success:
+            self._total_success += 1
+        if metrics.execution_count > self._most_used_count:
+            self._most_used_count = metrics.execution_count
+            self._most_used_name = command_name
+
+        self.logger.debug(
+            "Recorded metrics for command %s",
+            command_name,
+            command_name=command_name,
+            execution_time=execution_time,
+            success=success,
+        )
 
     async def get_command_metrics(self, command_name: str) -> Optional[CommandMetrics]:
         """
@@ -168,6 +198,7 @@ class BotStatsService(IBotStats):
         Returns:
             CommandMetrics object or None if not found
         """
+        command_name = sys.intern(command_name)
         async with self._lock:
             return self.command_metrics.get(command_name)
 
@@ -189,36 +220,22 @@ class BotStatsService(IBotStats):
             Dictionary with performance summary
         """
         async with self._lock:
-            stats = await self.get_stats()
+            stats = self.get_stats()
 
-            # Calculate average command execution time
-            total_execution_time = sum(
-                metrics.total_execution_time
-                for metrics in self.command_metrics.values()
-            )
-            total_executions = sum(
-                metrics.execution_count for metrics in self.command_metrics.values()
-            )
             avg_execution_time = (
-                total_execution_time / total_executions if total_executions > 0 else 0.0
+                self._total_exec_time / self._total_exec_count
+                if self._total_exec_count > 0
+                else 0.0
             )
 
-            # Find most used command
-            most_used_command = None
-            max_executions = 0
-            for metrics in self.command_metrics.values():
-                if metrics.execution_count > max_executions:
-                    max_executions = metrics.execution_count
-                    most_used_command = metrics.command_name
-
             return {
                 "uptime_hours": stats.uptime / (1000 * 60 * 60),
                 "total_commands": stats.commands_executed,
                 "total_messages": stats.messages_processed,
                 "avg_execution_time_ms": avg_execution_time,
                 "current_ping_ms": stats.ping,
-                "connection_status": stats.status.value,
-                "most_used_command": most_used_command,
+                "connection_status": CONNECTION_STATUS_NAMES[stats.status],
+                "most_used_command": self._most_used_name,
                 "unique_commands_used": len(self.command_metrics),
                 "success_rate": self._calculate_success_rate(),
             }
@@ -229,6 +246,11 @@ class BotStatsService(IBotStats):
             self.commands_executed = 0
             self.messages_processed = 0
             self.command_metrics.clear()
+            self._total_exec_time = 0.0
+            self._total_exec_count = 0
+            self._total_success = 0
+            self._most_used_name = None
+            self._most_used_count = 0
 
             self.logger.info("Bot statistics reset")
 
@@ -244,10 +266,14 @@ class BotStatsService(IBotStats):
             self.current_status = status
 
             if old_status != status:
+                old_name = CONNECTION_STATUS_NAMES[old_status]
+                new_name = CONNECTION_STATUS_NAMES[status]
                 self.logger.info(
-                    f"Connection status changed: {old_status.value} -> {status.value}",
-                    old_status=old_status.value,
-                    new_status=status.value,
+                    "Connection status changed: %s -> %s",
+                    old_name,
+                    new_name,
+                    old_status=old_name,
+                    new_status=new_name,
                 )
 
     def _calculate_success_rate(self) -> float:
@@ -257,17 +283,10 @@ class BotStatsService(IBotStats):
         Returns:
             Success rate as a percentage (0-100)
         """
-        total_success = sum(
-            metrics.success_count for metrics in self.command_metrics.values()
-        )
-        total_executions = sum(
-            metrics.execution_count for metrics in self.command_metrics.values()
-        )
-
-        if total_executions == 0:
+        if self._total_exec_count == 0:
             return 100.0
 
-        return (total_success / total_executions) * 100
+        return (self._total_success / self._total_exec_count) * 100
 
     async def export_metrics(self) -> Dict[str, any]:
         """
@@ -276,18 +295,20 @@ class BotStatsService(IBotStats):
         Returns:
             Dictionary with all metrics data
         """
+        # get_performance_summary takes the lock itself, so fetch it first
+        performance_summary = await self.get_performance_summary()
         async with self._lock:
-            stats = await self.get_stats()
+            stats = self.get_stats()
 
             return {
                 "timestamp": datetime.now().isoformat(),
                 "bot_stats": {
-                    "status": stats.status.value,
+                    "status": CONNECTION_STATUS_NAMES[stats.status],
                     "ping_ms": stats.ping,
                     "uptime_ms": stats.uptime,
                     "commands_executed": stats.commands_executed,
                     "messages_processed": stats.messages_processed,
-                    "start_time": stats.start_time.isoformat(),
+                    "start_time": self._start_time_iso,
                     "last_activity": stats.last_activity.isoformat(),
                 },
                 "command_metrics": {
@@ -299,13 +320,9 @@ class BotStatsService(IBotStats):
                         "max_execution_time": metrics.max_execution_time,
                         "success_count": metrics.success_count,
                         "error_count": metrics.error_count,
-                        "last_executed": (
-                            metrics.last_executed.isoformat()
-                            if metrics.last_executed
-                            else None
-                        ),
+                        "last_executed": metrics.get_last_executed_iso(),
                     }
                     for name, metrics in self.command_metrics.items()
                 },
-                "performance_summary": await self.get_performance_summary(),
+                "performance_summary": performance_summary,
             }
@@ -1,22 +1,70 @@
 import asyncio
-from typing import Dict, List, Optional
+from bisect import bisect_right
+from types import MappingProxyType
+from typing import Dict, List, Mapping, Optional, Tuple
 
 from core.exceptions import CommandError, ValidationError
 from core.interfaces import ICommand, ICommandRegistry
+from core.types import COMMAND_CATEGORIES, COMMAND_CATEGORY_OF_NAME
 from config.logging import StructuredLogger
 
 
 class CommandRegistry(ICommandRegistry):
+    __slots__ = (
+        "logger",
+        "_commands",
+        "_command_names",
+        "_commands_ro",
+        "_names_ro",
+        "_names_lower_ro",
+        "_snapshot",
+        "_version",
+        "_lower_index",
+        "_haystack",
+        "_offsets",
+        "_haystack_commands",
+        "_category_of",
+        "_categorized",
+        "_lock",
+        "_n_registered",
+        "_n_unregistered",
+        "_n_errors",
+    )
+
     def __init__(self) -> None:
         self.logger = StructuredLogger("services.command_registry")
         self._commands: Dict[str, ICommand] = {}
         self._command_names: Dict[str, ICommand] = {}
+        # Read-only snapshots of the two maps, republished after every write so
+        # lookups can read them without taking the lock.
+        self._commands_ro: Mapping[str, ICommand] = MappingProxyType({})
+        self._names_ro: Mapping[str, ICommand] = MappingProxyType({})
+        # Lowercased name -> first registered command with that name, for
+        # case-insensitive lookups
+        self._names_lower_ro: Mapping[str, ICommand] = MappingProxyType({})
+        # Registered commands as a tuple, with a generation counter bumped on
+        # every publish so callers can cache derived views cheaply
+        self._snapshot: Tuple[ICommand, ...] = ()
+        self._version = 0
+        # (trigger.lower(), name.lower(), command) keyed by trigger, computed once
+        # at registration so searches and categorization never re-lowercase
+        self._lower_index: Dict[str, Tuple[str, str, ICommand]] = {}
+        # Lowercased triggers joined into one NUL-separated string so substring
+        # searches run in str.find; _offsets holds each trigger's start plus a
+        # final end sentinel, parallel to _haystack_commands.
+        self._haystack = ""
+        self._offsets: List[int] = [0]
+        self._haystack_commands: List[ICommand] = []
+        # Category of each command, computed once at registration
+        self._category_of: Dict[str, str] = {}
+        # Commands grouped by category, built lazily by get_categorized and
+        # dropped on every publish
+        self._categorized: Optional[Mapping[str, Tuple[ICommand, ...]]] = None
+        # Serializes writers only; every read is synchronous and lock-free
         self._lock = asyncio.Lock()
-        self._stats = {
-            "total_registered": 0,
-            "total_unregistered": 0,
-            "registration_errors": 0,
-        }
+        self._n_registered = 0
+        self._n_unregistered = 0
+        self._n_errors = 0
         self.logger.info("Command registry initialized")
 
     async def register(self, command: ICommand) -> None:
@@ -27,64 +75,98 @@ class CommandRegistry(ICommandRegistry):
                 error_code="NULL_COMMAND",
             )
 
-        await self._validate_command(command)
+        self._validate_command(command)
 
+        trigger = command.trigger
+        name = command.name
         async with self._lock:
+            commands = self._commands
+            command_names = self._command_names
             try:
-                if command.trigger in self._commands:
-                    existing_command = self._commands[command.trigger]
-                    self.logger.warning(
-                        f"Overwriting command '{existing_command.name}' with '{command.name}'",
-                        trigger=command.trigger,
-                        existing_command=existing_command.name,
-                        new_command=command.name,
-                    )
-
-                if command.name in self._command_names:
-                    existing_command = self._command_names[command.name]
-                    if existing_command.trigger != command.trigger:
+                by_trigger = commands.get(trigger)
+                by_name = command_names.get(name)
+                if by_trigger is not None or by_name is not None:
+                    # Slow path: replacing or conflicting with an existing command
+                    if by_trigger is not None:
+                        self.logger.warning(
+                            "Overwriting command '%s' with '%s'",
+                            by_trigger.name,
+                            name,
+                            trigger=trigger,
+                            existing_command=by_trigger.name,
+                            new_command=name,
+                        )
+
+                    if by_name is not None and by_name.trigger != trigger:
                         raise CommandError(
-                            f"Command name '{command.name}' already exists with "
-                            f"different trigger '{existing_command.trigger}'",
-                            command_name=command.name,
+                            f"Command name '{name}' already exists with "
+                            f"different trigger '{by_name.trigger}'",
+                            command_name=name,
                             error_code="DUPLICATE_COMMAND_NAME",
                         )
 
-                self._commands[command.trigger] = command
-                self._command_names[command.name] = command
-                self._stats["total_registered"] += 1
+                commands[trigger] = command
+                command_names[name] = command
+                name_lower = name.lower()
+                self._lower_index[trigger] = (trigger.lower(), name_lower, command)
+                self._category_of[name] = self._categorize_command(name_lower)
+                self._publish()
+                self._n_registered += 1
 
-                self.logger.info(f"Registered command: {command.name}", trigger=command.trigger)
+                self.logger.info("Registered command: %s", name, trigger=trigger)
             except Exception as e:
-                self._stats["registration_errors"] += 1
-                self.logger.error(f"Failed to register command: {command.name}", error=str(e))
+                self._n_errors += 1
+                self.logger.error("Failed to register command: %s", name, error=str(e))
                 raise
 
-    async def get_command(self, trigger: str) -> Optional[ICommand]:
+    def get_command(self, trigger: str) -> Optional[ICommand]:
         """Get a command by its trigger."""
         if not trigger:
             return None
-        async with self._lock:
-            return self._commands.get(trigger)
+        return self._commands_ro.get(trigger)
 
-    async def get_command_by_name(self, name: str) -> Optional[ICommand]:
-        """Get a command by its name."""
+    def get_command_by_name(
+        self, name: str, ignore_case: bool = False
+    ) -> Optional[ICommand]:
+        """Get a command by its name, optionally ignoring case."""
         if not name:
             return None
-        async with self._lock:
-            return self._command_names.get(name)
+        if ignore_case:
+            return self._names_lower_ro.get(name.lower())
+        return self._names_ro.get(name)
 
-    async def get_all_commands(self) -> List[ICommand]:
+    def get_all_commands(self) -> List[ICommand]:
         """Get all registered commands."""
-        async with self._lock:
-            return list(self._commands.values())
+        return list(self._snapshot)
+
+    @property
+    def snapshot_version(self) -> int:
+        """Generation counter, incremented whenever the registry changes."""
+        return self._version
+
+    @property
+    def snapshot_commands(self) -> Tuple[ICommand, ...]:
+        """Registered commands in registration order, as an immutable tuple."""
+        return self._snapshot
+
+    @property
+    def command_count(self) -> int:
+        """Number of registered commands."""
+        return len(self._snapshot)
 
-    async def has_command(self, trigger: str) -> bool:
+    @property
+    def enabled_count(self) -> int:
+        """Number of registered commands that are currently enabled.
+
+        Counted live, since command configs can change after registration.
+        """
+        return sum(1 for command in self._snapshot if command.get_config().enabled)
+
+    def has_command(self, trigger: str) -> bool:
         """Check if a trigger is registered."""
         if not trigger:
             return False
-        async with self._lock:
-            return trigger in self._commands
+        return trigger in self._commands_ro
 
     async def unregister(self, trigger: str) -> bool:
         """Unregister a command by trigger."""
@@ -92,139 +174,181 @@ class CommandRegistry(ICommandRegistry):
             return False
 
         async with self._lock:
-            command = self._commands.get(trigger)
-            if command:
-                del self._commands[trigger]
-                if command.name in self._command_names:
-                    del self._command_names[command.name]
-
-                self._stats["total_unregistered"] += 1
-                self.logger.info(
-                    f"Unregistered command: {command.name}",
-                    command_name=command.name,
-                    trigger=trigger,
-                    total_commands=len(self._commands),
-                )
-                return True
-            else:
-                self.logger.warning(f"Command not found: {trigger}", trigger=trigger)
+            command = self._commands.pop(trigger, None)
+            if command is None:
+                self.logger.warning("Command not found: %s", trigger, trigger=trigger)
                 return False
 
+            name = command.name
+            del self._lower_index[trigger]
+            self._command_names.pop(name, None)
+            self._category_of.pop(name, None)
+            self._publish()
+
+            self._n_unregistered += 1
+            self.logger.info(
+                "Unregistered command: %s",
+                name,
+                command_name=name,
+                trigger=trigger,
+                total_commands=len(self._commands),
+            )
+            return True
+
     async def clear(self) -> None:
         """Clear all registered commands."""
         async with self._lock:
             command_count = len(self._commands)
             self._commands.clear()
             self._command_names.clear()
+            self._lower_index.clear()
+            self._category_of.clear()
+            self._publish()
             self.logger.info(
-                f"Cleared {command_count} commands", cleared_count=command_count
+                "Cleared %d commands", command_count, cleared_count=command_count
             )
 
     async def get_stats(self) -> Dict[str, any]:
         """Get command registry statistics."""
-        async with self._lock:
-            commands = list(self._commands.values())
-            return {
-                "total_commands": len(commands),
-                "triggers": list(self._commands.keys()),
-                "command_names": [cmd.name for cmd in commands],
-                "enabled_commands": len(
-                    [cmd for cmd in commands if cmd.get_config().enabled]
-                ),
-                "disabled_commands": len(
-                    [cmd for cmd in commands if not cmd.get_config().enabled]
-                ),
-                "registration_stats": self._stats.copy(),
-            }
-
-    async def find_commands(self, partial_trigger: str) -> List[ICommand]:
+        commands = self._commands_ro
+        enabled = self.enabled_count
+        return {
+            "total_commands": len(commands),
+            "triggers": list(commands),
+            "command_names": list(self._names_ro),
+            "enabled_commands": enabled,
+            "disabled_commands": len(commands) - enabled,
+            "registration_stats": {
+                "total_registered": self._n_registered,
+                "total_unregistered": self._n_unregistered,
+                "registration_errors": self._n_errors,
+            },
+        }
+
+    def find_commands(self, partial_trigger: str) -> List[ICommand]:
         """Find commands that match a partial trigger."""
         if not partial_trigger:
             return []
 
-        async with self._lock:
-            partial_lower = partial_trigger.lower()
-            return [
-                command
-                for trigger, command in self._commands.items()
-                if partial_lower in trigger.lower()
-            ]
-
-    async def get_commands_by_category(self) -> Dict[str, List[ICommand]]:
+        partial_lower = partial_trigger.lower()
+        if "\x00" in partial_lower:
+            return []
+
+        haystack = self._haystack
+        offsets = self._offsets
+        commands = self._haystack_commands
+        matches = []
+        pos = haystack.find(partial_lower)
+        while pos != -1:
+            index = bisect_right(offsets, pos) - 1
+            matches.append(commands[index])
+            # Resume at the next trigger so each command matches at most once
+            pos = haystack.find(partial_lower, offsets[index + 1])
+        return matches
+
+    def get_commands_by_category(self) -> Dict[str, List[ICommand]]:
         """Get commands grouped by category."""
-        async with self._lock:
-            categories: Dict[str, List[ICommand]] = {}
-            for command in self._commands.values():
-                category = self._categorize_command(command)
-                if category not in categories:
-                    categories[category] = []
-                categories[category].append(command)
-            return categories
+        categories: Dict[str, List[ICommand]] = {}
+        category_of = self._category_of
+        for command in self._commands_ro.values():
+            categories.setdefault(category_of[command.name], []).append(command)
+        return categories
+
+    def get_category(self, name: str) -> str:
+        """Get the category of a registered command, or "Other"."""
+        return self._category_of.get(name, "Other")
+
+    def get_categorized(self) -> Mapping[str, Tuple[ICommand, ...]]:
+        """Get non-empty categories in display order, memoized until the next change."""
+        categorized = self._categorized
+        if categorized is None:
+            grouped: Dict[str, List[ICommand]] = {name: [] for name in COMMAND_CATEGORIES}
+            category_of = self._category_of
+            for command in self._snapshot:
+                grouped[category_of[command.name]].append(command)
+            categorized = MappingProxyType(
+                {name: tuple(cmds) for name, cmds in grouped.items() if cmds}
+            )
+            self._categorized = categorized
+        return categorized
 
     async def validate_all_commands(self) -> Dict[str, List[str]]:
         """Validate all registered commands."""
-        async with self._lock:
-            results = {"valid": [], "invalid": [], "errors": []}
-            for command in self._commands.values():
-                try:
-                    await self._validate_command(command)
-                    results["valid"].append(command.name)
-                except Exception as e:
-                    results["invalid"].append(command.name)
-                    results["errors"].append(f"{command.name}: {str(e)}")
-            return results
-
-    async def _validate_command(self, command: ICommand) -> None:
+        # Validation only reads the commands, so work from the published snapshot
+        # rather than holding the lock while every command is checked.
+        results = {"valid": [], "invalid": [], "errors": []}
+        for command in self._commands_ro.values():
+            try:
+                self._validate_command(command)
+                results["valid"].append(command.name)
+            except Exception as e:
+                results["invalid"].append(command.name)
+                results["errors"].append(f"{command.name}: {str(e)}")
+        return results
+
+    def _publish(self) -> None:
+        """Publish read-only copies of the command maps (caller holds the lock)."""
+        self._commands_ro = MappingProxyType(dict(self._commands))
+        self._names_ro = MappingProxyType(dict(self._command_names))
+        self._snapshot = tuple(self._commands.values())
+        self._version += 1
+        self._categorized = None
+
+        offsets = [0]
+        position = 0
+        lowered = []
+        commands = []
+        names_lower: Dict[str, ICommand] = {}
+        for trigger_lower, name_lower, command in self._lower_index.values():
+            names_lower.setdefault(name_lower, command)
+            lowered.append(trigger_lower)
+            commands.append(command)
+            position += len(trigger_lower) + 1
+            offsets.append(position)
+        self._haystack = "\x00".join(lowered) + "\x00" if lowered else ""
+        self._offsets = offsets
+        self._haystack_commands = commands
+        self._names_lower_ro = MappingProxyType(names_lower)
+
+    def _validate_command(self, command: ICommand) -> None:
         """Validate a command implementation."""
-        if not hasattr(command, "name") or not command.name:
+        if not getattr(command, "name", None):
             raise ValidationError(
                 "Command must have a non-empty name",
                 field_name="name",
                 error_code="MISSING_NAME",
             )
 
-        if not hasattr(command, "description") or not command.description:
+        if not getattr(command, "description", None):
             raise ValidationError(
                 "Command must have a non-empty description",
                 field_name="description",
                 error_code="MISSING_DESCRIPTION",
             )
 
-        if not hasattr(command, "trigger") or not command.trigger:
+        trigger = getattr(command, "trigger", None)
+        if not trigger:
             raise ValidationError(
                 "Command must have a non-empty trigger",
                 field_name="trigger",
                 error_code="MISSING_TRIGGER",
             )
 
-        if not hasattr(command, "execute") or not callable(command.execute):
+        if not callable(getattr(command, "execute", None)):
             raise ValidationError(
                 "Command must have an executable 'execute' method",
                 field_name="execute",
                 error_code="MISSING_EXECUTE_METHOD",
             )
 
-        if not command.trigger.startswith("."):
+        if not trigger.startswith("."):
             raise ValidationError(
                 "Command trigger must start with '.'",
                 field_name="trigger",
-                field_value=command.trigger,
+                field_value=trigger,
                 error_code="INVALID_TRIGGER_FORMAT",
             )
 
-    def _categorize_command(self, command: ICommand) -> str:
-        """Categorize a command based on its name."""
-        name_lower = command.name.lower()
-
-        categories = {
-            "Utility": {"ping", "help", "status", "info", "stats"},
-            "Fun": {"hurt", "owo", "meow", "hentai", "joke", "meme"},
-            "Moderation": {"ban", "kick", "mute", "warn", "clear"},
-            "Information": {"user", "server", "channel", "role"},
-        }
-
-        for category, commands in categories.items():
-            if name_lower in commands:
-                return category
-
-        return "Other"
+    def _categorize_command(self, name_lower: str) -> str:
+        """Categorize a command based on its lowercased name."""
+        return COMMAND_CATEGORY_OF_NAME.get(name_lower, "Other")
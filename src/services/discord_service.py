@@ -1,7 +1,8 @@
 # Discord service for self-bot operations.
 import asyncio
+import logging
 import time
-from typing import Optional
+from typing import Any, Dict, Optional, Tuple
 
 import discord
 
@@ -9,9 +10,15 @@ from config.logging import StructuredLogger
 from config.settings import Settings
 from core.exceptions import ConnectionError
 from core.interfaces import ICommand, IDiscordService
+from core.types import CONNECTION_STATUS_NAMES
+from utils.validators import is_token_format_valid
 from .bot_stats import BotStatsService
 from .command_registry import CommandRegistry
 
+# Trie key holding (registration index, command) on a trigger's final node.
+# Children are keyed by single characters, so the empty string never collides.
+_TRIE_END = ""
+
 
 class DiscordService(IDiscordService):
     def __init__(
@@ -35,6 +42,14 @@ class DiscordService(IDiscordService):
         self.command_registry = command_registry or CommandRegistry()
         self.bot_stats = bot_stats or BotStatsService(self.client)
 
+        # Character trie of command triggers for message dispatch, rebuilt when
+        # the registry's snapshot version moves on, plus the flat trigger tuple
+        self._trigger_trie: Dict[str, Any] = {}
+        self._triggers: Tuple[str, ...] = ()
+        self._trie_version = -1
+        # The bot user's id, cached once the client is ready
+        self._self_id: Optional[int] = None
+
         # State management
         self._is_running = False
         self._shutdown_event = asyncio.Event()
@@ -52,11 +67,6 @@ class DiscordService(IDiscordService):
         try:
             self.logger.info("Starting Discord service...")
 
-            # Validate token before attempting connection
-            await self._validate_token()
-
-            # Connect to Discord
-            self.logger.info("Connecting to Discord...")
             # For self-bots (user tokens), we need to ensure proper format
             # Discord.py expects user tokens without any prefix
             token = self.settings.discord_token.strip()
@@ -67,7 +77,13 @@ class DiscordService(IDiscordService):
             elif token.startswith("Bot "):
                 token = token[4:]
 
-            self.logger.debug(f"Using token: {token[:10]}...")
+            # Validate token before attempting connection
+            self._validate_token_format(token)
+
+            # Connect to Discord
+            self.logger.info("Connecting to Discord...")
+
+            self.logger.debug("Using token: %s...", token[:10])
             await self.client.login(token)
 
             # Start the client
@@ -82,13 +98,10 @@ class DiscordService(IDiscordService):
                 [client_task, shutdown_task], return_when=asyncio.FIRST_COMPLETED
             )
 
-            # Cancel pending tasks
+            # Cancel pending tasks and wait for them to unwind together
             for task in pending:
                 task.cancel()
-                try:
-                    await task
-                except asyncio.CancelledError:
-                    pass
+            await asyncio.gather(*pending, return_exceptions=True)
 
             # Check if client task completed with an error
             if client_task in done:
@@ -105,7 +118,7 @@ class DiscordService(IDiscordService):
 
         except Exception as e:
             self._is_running = False
-            self.logger.error(f"Failed to start Discord service: {e}")
+            self.logger.error("Failed to start Discord service: %s", e)
             await self._handle_connection_error(e)
             raise
 
@@ -129,7 +142,7 @@ class DiscordService(IDiscordService):
             self.logger.info("Discord service stopped successfully")
 
         except Exception as e:
-            self.logger.error(f"Error stopping Discord service: {e}")
+            self.logger.error("Error stopping Discord service: %s", e)
             raise
 
     async def register_command(self, command: ICommand) -> None:
@@ -140,7 +153,7 @@ class DiscordService(IDiscordService):
             command: The command to register
         """
         await self.command_registry.register(command)
-        self.logger.info(f"Registered command: {command.name}")
+        self.logger.info("Registered command: %s", command.name)
 
     def get_client(self) -> discord.Client:
         """
@@ -157,9 +170,12 @@ class DiscordService(IDiscordService):
         @self.client.event
         async def on_ready():
             """Handle client ready event."""
+            await self.bot_stats.on_ready()
             user = self.client.user
+            self._self_id = user.id if user else None
             self.logger.info(
-                f"Bot logged in as {user}",
+                "Bot logged in as %s",
+                user,
                 user_id=str(user.id) if user else None,
                 username=str(user) if user else None,
             )
@@ -173,94 +189,129 @@ class DiscordService(IDiscordService):
         @self.client.event
         async def on_error(event, *args, **kwargs):
             """Handle Discord client errors."""
-            self.logger.error(f"Discord client error in {event}", event=event)
+            await self.bot_stats.on_error(event)
+            self.logger.error("Discord client error in %s", event, event=event)
 
         @self.client.event
         async def on_disconnect():
             """Handle client disconnect."""
+            await self.bot_stats.on_disconnect()
             self.logger.warning("Disconnected from Discord")
 
         @self.client.event
         async def on_resumed():
             """Handle client resume."""
+            await self.bot_stats.on_resumed()
             self.logger.info("Connection to Discord resumed")
 
     async def _handle_message(self, message: discord.Message) -> None:
         try:
-            # Update message processing stats
-            await self.bot_stats.increment_messages_processed()
-
-            # Skip if message is not from the bot user (self-bot only responds to own messages)
-            if not message.author or message.author.id != self.client.user.id:
+            # Self-bot only responds to its own messages; anything else is
+            # dropped before it reaches the stats service
+            author = message.author
+            if not author or author.id != self._self_id:
                 return
 
-            # Skip empty messages
-            if not message.content or not message.content.strip():
-                return
+            command = None
+            content = message.content.strip() if message.content else ""
+            if content:
+                command = self._find_matching_command(content)
 
-            content = message.content.strip()
+            if command is None:
+                await self.bot_stats.increment_messages_processed()
+                return
 
-            # Find matching command
-            command = await self._find_matching_command(content)
-            if command:
+            debug = self.logger.isEnabledFor(logging.DEBUG)
+            if debug:
                 self.logger.debug(
-                    f"Executing command: {command.name}",
+                    "Executing command: %s",
+                    command.name,
                     command_name=command.name,
                     trigger=command.trigger,
-                    user_id=str(message.author.id),
+                    user_id=str(author.id),
                 )
 
-                # Execute command and track statistics
-                start_time = time.time()
-                result = await command.execute(message)
-                execution_time = (time.time() - start_time) * 1000
+            # Execute command and track statistics
+            start_ns = time.perf_counter_ns()
+            result = await command.execute(message)
+            execution_time = (time.perf_counter_ns() - start_ns) / 1_000_000
 
-                # Update statistics
-                await self.bot_stats.increment_commands_executed()
-                await self.bot_stats.record_command_execution(
-                    command.name, execution_time, result.success
-                )
+            # Update message and command statistics in one call
+            await self.bot_stats.record_message_and_command(
+                command.name, execution_time, result.success
+            )
 
-                if result.success:
+            if result.success:
+                if debug:
                     self.logger.debug(
-                        f"Command {command.name} executed successfully",
+                        "Command %s executed successfully",
+                        command.name,
                         command_name=command.name,
                         execution_time=execution_time,
                         response_time=result.response_time,
                     )
-                else:
-                    self.logger.warning(
-                        f"Command {command.name} failed: {result.error}",
-                        command_name=command.name,
-                        error=result.error,
-                        execution_time=execution_time,
-                    )
+            elif self.logger.isEnabledFor(logging.WARNING):
+                self.logger.warning(
+                    "Command %s failed: %s",
+                    command.name,
+                    result.error,
+                    command_name=command.name,
+                    error=result.error,
+                    execution_time=execution_time,
+                )
 
         except Exception as e:
-            self.logger.error(f"Error handling message: {e}", error=str(e))
-
-    async def _find_matching_command(self, content: str) -> Optional[ICommand]:
-        # Get all registered commands
-        commands = await self.command_registry.get_all_commands()
-
-        # Find command with matching trigger
-        for command in commands:
-            if content.startswith(command.trigger):
-                # Check if command is enabled
-                if command.get_config().enabled:
-                    return command
-                else:
-                    self.logger.debug(
-                        f"Command {command.name} is disabled", command_name=command.name
-                    )
-
-        return None
+            self.logger.error("Error handling message: %s", e, error=str(e))
+
+    def _refresh_command_snapshot(self) -> None:
+        """Rebuild the trigger trie from the command registry."""
+        registry = self.command_registry
+        trie: Dict[str, Any] = {}
+        for index, command in enumerate(registry.snapshot_commands):
+            node = trie
+            for char in command.trigger:
+                node = node.setdefault(char, {})
+            node[_TRIE_END] = (index, command)
+        self._trigger_trie = trie
+        self._triggers = tuple(command.trigger for command in registry.snapshot_commands)
+        self._trie_version = registry.snapshot_version
+
+    def _find_matching_command(self, content: str) -> Optional[ICommand]:
+        if self.command_registry.snapshot_version != self._trie_version:
+            self._refresh_command_snapshot()
+
+        # One C-level probe rejects the common case of a message that starts
+        # with no trigger at all, before any per-character work
+        if not content.startswith(self._triggers):
+            return None
+
+        # Walk the trie along the message; every trigger that prefixes it is
+        # seen on the way down. The earliest registered enabled one wins.
+        # Enabled is read live because configs can change without the
+        # registry's snapshot version moving.
+        node = self._trigger_trie
+        match = None
+        for char in content:
+            node = node.get(char)
+            if node is None:
+                break
+            entry = node.get(_TRIE_END)
+            if entry is None:
+                continue
+            index, command = entry
+            if match is not None and index > match[0]:
+                continue
+            if command.get_config().enabled:
+                match = entry
+            elif self.logger.isEnabledFor(logging.DEBUG):
+                self.logger.debug(
+                    "Command %s is disabled", command.name, command_name=command.name
+                )
 
-    async def _validate_token(self) -> None:
-        token = self.settings.discord_token
+        return None if match is None else match[1]
 
-        # Basic format validation
-        if not token or len(token) < 50:
+    def _validate_token_format(self, token: str) -> None:
+        if not is_token_format_valid(token):
             raise ConnectionError(
                 "Invalid Discord token format",
                 connection_type="token_validation",
@@ -297,18 +348,18 @@ class DiscordService(IDiscordService):
         return self._is_running
 
     async def get_service_status(self) -> dict:
-        stats = await self.bot_stats.get_stats()
-        registry_stats = await self.command_registry.get_stats()
+        stats = self.bot_stats.get_stats()
+        registry = self.command_registry
 
         return {
             "service_running": self._is_running,
             "client_ready": self.client.is_ready() if self.client else False,
             "client_closed": self.client.is_closed() if self.client else True,
-            "connection_status": stats.status.value,
+            "connection_status": CONNECTION_STATUS_NAMES[stats.status],
             "uptime_ms": stats.uptime,
             "ping_ms": stats.ping,
             "commands_executed": stats.commands_executed,
             "messages_processed": stats.messages_processed,
-            "registered_commands": registry_stats["total_commands"],
-            "enabled_commands": registry_stats["enabled_commands"],
+            "registered_commands": registry.command_count,
+            "enabled_commands": registry.enabled_count,
         }
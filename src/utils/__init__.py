@@ -1,8 +1,14 @@
-from .validators import TokenValidator, validate_token_format, validate_token_api
+from .validators import (
+    TokenValidator,
+    is_token_format_valid,
+    validate_token_format,
+    validate_token_api,
+)
 from .formatters import MessageFormatter, format_help_message, format_error_message
 
 __all__ = [
     "TokenValidator",
+    "is_token_format_valid",
     "validate_token_format",
     "validate_token_api",
     "MessageFormatter",
@@ -1,4 +1,4 @@
-from typing import Dict, List, Optional, Any
+from typing import List, Optional
 
 try:
     from ..core.types import CommandConfig
@@ -6,11 +6,15 @@ except ImportError:
     from core.types import CommandConfig
 
 
+_OK_PREFIX = "✅ "
+_FAIL_PREFIX = "❌ "
+_ERROR_PREFIX = "❌ **Error:** "
+
+
 class MessageFormatter:
     @staticmethod
     def format_command_output(content: str, success: bool = True) -> str:
-        prefix = "\u2705" if success else "\u274c"
-        return f"{prefix} {content}"
+        return (_OK_PREFIX if success else _FAIL_PREFIX) + content
     
     @staticmethod
     def format_code_block(content: str, language: str = "") -> str:
@@ -44,7 +48,7 @@ def format_help_message(command_config: CommandConfig, name: str, description: s
 
 
 def format_error_message(error_text: str, details: Optional[str] = None) -> str:
-    message = f"❌ **Error:** {error_text}"
+    message = _ERROR_PREFIX + error_text
     
     if details:
         message += f"\n```{details}```"
@@ -80,11 +84,22 @@ def format_command_config(config: CommandConfig) -> str:
     return formatted_string
 
 
+# Last (whole seconds, formatted) pair; status displays re-format the same value often
+_last_duration = (None, "")
+
+
 def format_duration(seconds: float) -> str:
     """
     Formats a duration in seconds into a human-readable string (e.g., '1h 30m 5s').
     """
-    minutes, seconds = divmod(int(seconds), 60)
+    global _last_duration
+    total = int(seconds)
+    if 0 <= total < 60:
+        return f"{total}s"
+    if _last_duration[0] == total:
+        return _last_duration[1]
+
+    minutes, seconds = divmod(total, 60)
     hours, minutes = divmod(minutes, 60)
     days, hours = divmod(hours, 24)
 
@@ -98,4 +113,6 @@ def format_duration(seconds: float) -> str:
     if seconds or not parts:  # Include seconds if there are any, or if the duration is 0
         parts.append(f"{seconds}s")
 
-    return " ".join(parts)
\ No newline at end of file
+    formatted = " ".join(parts)
+    _last_duration = (total, formatted)
+    return formatted
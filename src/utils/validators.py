@@ -1,79 +1,165 @@
 import re
 import base64
-import json
-from typing import Dict, Optional, Tuple
+from typing import Dict, Iterable, List, Optional, Tuple
 import aiohttp
 import asyncio
+import hashlib
+import orjson
+import time
+from collections import OrderedDict
+from functools import lru_cache
 
 try:
-    from ..core.exceptions import ValidationError
     from ..core.interfaces import ITokenValidator
     from ..core.types import TokenInfo
     from ..config.logging import StructuredLogger
 except ImportError:
-    from core.exceptions import ValidationError
     from core.interfaces import ITokenValidator
     from core.types import TokenInfo
     from config.logging import StructuredLogger
 
 
+# Bot token, MFA token or legacy user token in one anchored alternation; the
+# mfa. arm precedes the bare user-token arm so the more specific one is tried first
+_TOKEN_RE = re.compile(
+    r'^(?:[A-Za-z0-9_-]{23,28}\.[A-Za-z0-9_-]{6,7}\.[A-Za-z0-9_-]{27,}'
+    r'|mfa\.[A-Za-z0-9_-]{84,}'
+    r'|[A-Za-z0-9_-]{59,})$'
+)
+
+# /users/@me results are cached per token: successes for a minute, 401s briefly
+# so retries of a bad token don't hammer the API
+_API_CACHE_TTL = 60.0
+_API_NEGATIVE_TTL = 5.0
+_API_CACHE_SIZE = 256
+_MISS = object()
+
+# Static headers for every API request; a GET has no body, so no Content-Type
+_BASE_HEADERS = {
+    "User-Agent": "DiscordBot (https://github.com/discord-selfbot, 1.0.0)",
+}
+
+
+def is_token_format_valid(token: str) -> bool:
+    if not token or not isinstance(token, str):
+        return False
+    
+    token = token.strip()
+    
+    if len(token) < 50:
+        return False
+    
+    # The first dot's position rules out most malformed tokens before the regex:
+    # user tokens have none, MFA tokens have it after "mfa", bot tokens at 23-28
+    dot = token.find('.')
+    if dot == -1:
+        if len(token) < 59:
+            return False
+    elif dot == 3:
+        if not token.startswith('mfa'):
+            return False
+    elif not 23 <= dot <= 28:
+        return False
+    
+    return _TOKEN_RE.match(token) is not None
+
+
+def _token_key(token: str) -> bytes:
+    return hashlib.blake2b(token.encode(), digest_size=16).digest()
+
+
+@lru_cache(maxsize=2048)
+def _decode_user_id(token_head: str) -> Optional[str]:
+    try:
+        return base64.urlsafe_b64decode(token_head + '=' * (-len(token_head) % 4)).decode('ascii')
+    except Exception:
+        return None
+
+
 class TokenValidator(ITokenValidator):
     def __init__(self, timeout: float = 10.0) -> None:
         self.timeout = timeout
+        self._timeout_cfg = aiohttp.ClientTimeout(total=timeout)
         self.logger = StructuredLogger("utils.token_validator")
         self.api_base = "https://discord.com/api/v10"
         self.user_endpoint = f"{self.api_base}/users/@me"
-        self.token_patterns = [
-            re.compile(r'^[A-Za-z0-9_-]{23,28}\.[A-Za-z0-9_-]{6,7}\.[A-Za-z0-9_-]{27,}$'),
-            re.compile(r'^[A-Za-z0-9_-]{59,}$'),
-            re.compile(r'^mfa\.[A-Za-z0-9_-]{84,}$'),
-        ]
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._session_lock = asyncio.Lock()
+        # Both caches are keyed by a digest of the token, never the token itself
+        self._api_cache: "OrderedDict[bytes, Tuple[float, Tuple[int, Optional[Dict[str, any]]]]]" = OrderedDict()
+        self._info_cache: "OrderedDict[bytes, Tuple[float, TokenInfo]]" = OrderedDict()
+    
+    async def _get_session(self) -> aiohttp.ClientSession:
+        if self._session is None or self._session.closed:
+            async with self._session_lock:
+                if self._session is None or self._session.closed:
+                    self._session = aiohttp.ClientSession(
+                        connector=aiohttp.TCPConnector(
+                            limit=32, ttl_dns_cache=300, keepalive_timeout=30
+                        ),
+                        timeout=self._timeout_cfg,
+                    )
+        return self._session
+    
+    async def aclose(self) -> None:
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+    
+    async def __aenter__(self) -> "TokenValidator":
+        return self
+    
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        await self.aclose()
+    
+    def _cache_get(self, cache: OrderedDict, key: bytes) -> any:
+        entry = cache.get(key)
+        if entry is None:
+            return _MISS
+        if time.monotonic() >= entry[0]:
+            del cache[key]
+            return _MISS
+        cache.move_to_end(key)
+        return entry[1]
+    
+    def _cache_put(self, cache: OrderedDict, key: bytes, value: any, ttl: float) -> None:
+        cache[key] = (time.monotonic() + ttl, value)
+        cache.move_to_end(key)
+        if len(cache) > _API_CACHE_SIZE:
+            cache.popitem(last=False)
     
     async def validate_format(self, token: str) -> bool:
-        if not token or not isinstance(token, str):
-            return False
-        
-        token = token.strip()
-        
-        if len(token) < 50:
-            return False
-        
-        for pattern in self.token_patterns:
-            if pattern.match(token):
-                self.logger.debug("Token format validation passed")
-                return True
+        return self._validate_format_sync(token)
+
+    def _validate_format_sync(self, token: str) -> bool:
+        if is_token_format_valid(token):
+            self.logger.debug("Token format validation passed")
+            return True
         
         self.logger.debug("Token format validation failed")
         return False
     
     async def validate_api(self, token: str) -> bool:
         try:
-            if not await self.validate_format(token):
+            if not self._validate_format_sync(token):
                 return False
             
-            headers = {
-                "Authorization": token,
-                "Content-Type": "application/json",
-                "User-Agent": "DiscordBot (https://github.com/discord-selfbot, 1.0.0)"
-            }
-            
-            async with aiohttp.ClientSession(timeout=aiohttp.ClientTimeout(total=self.timeout)) as session:
-                async with session.get(self.user_endpoint, headers=headers) as response:
-                    if response.status == 200:
-                        self.logger.debug("Token API validation passed")
-                        return True
-                    elif response.status == 401:
-                        self.logger.debug("Token API validation failed: Unauthorized")
-                        return False
-                    else:
-                        self.logger.warning(f"Token API validation failed: HTTP {response.status}")
-                        return False
+            status, _ = await self._fetch_user(token)
+            if status == 200:
+                self.logger.debug("Token API validation passed")
+                return True
+            elif status == 401:
+                self.logger.debug("Token API validation failed: Unauthorized")
+                return False
+            else:
+                self.logger.warning("Token API validation failed: HTTP %s", status)
+                return False
         
         except asyncio.TimeoutError:
             self.logger.warning("Token API validation timed out")
             return False
         except Exception as e:
-            self.logger.error(f"Token API validation error: {e}")
+            self.logger.error("Token API validation error: %s", e)
             return False
     
     async def extract_info(self, token: str) -> Dict[str, any]:
@@ -92,7 +178,7 @@ class TokenValidator(ITokenValidator):
         }
         
         try:
-            info["format_valid"] = await self.validate_format(token)
+            info["format_valid"] = self._validate_format_sync(token)
             if not info["format_valid"]:
                 info["error"] = "Invalid token format"
                 return info
@@ -101,8 +187,8 @@ class TokenValidator(ITokenValidator):
             if user_id:
                 info["user_id"] = user_id
             
-            user_data = await self._get_user_data(token)
-            if user_data:
+            status, user_data = await self._fetch_user(token)
+            if status == 200 and user_data:
                 info["api_valid"] = True
                 info["token_valid"] = True
                 
@@ -120,79 +206,127 @@ class TokenValidator(ITokenValidator):
         
         except Exception as e:
             info["error"] = str(e)
-            self.logger.error(f"Error extracting token info: {e}")
+            self.logger.error("Error extracting token info: %s", e)
         
         return info
     
     async def create_token_info(self, token: str) -> TokenInfo:
-        info = await self.extract_info(token)
+        # Builds the TokenInfo directly rather than through extract_info's dict;
+        # token is masked in TokenInfo.__post_init__. Only valid results are
+        # cached, since failures may be transient (e.g. rate limits).
+        key = _token_key(token)
+        cached = self._cache_get(self._info_cache, key)
+        if cached is not _MISS:
+            return cached
+        
+        user_id = None
+        try:
+            if not self._validate_format_sync(token):
+                return TokenInfo(
+                    token=token, is_valid=False, error_message="Invalid token format"
+                )
+            
+            user_id = self._extract_user_id_from_token(token)
+            
+            status, user_data = await self._fetch_user(token)
+            if status == 200 and user_data:
+                info = TokenInfo(
+                    token=token,
+                    is_valid=True,
+                    user_id=str(user_data.get("id", "")),
+                    username=user_data.get("username", ""),
+                    discriminator=user_data.get("discriminator", ""),
+                    verified=user_data.get("verified", False),
+                    mfa_enabled=user_data.get("mfa_enabled", False),
+                )
+                self._cache_put(self._info_cache, key, info, _API_CACHE_TTL)
+                return info
+            
+            error_message = "Token is invalid or expired"
+        
+        except Exception as e:
+            error_message = str(e)
+            self.logger.error("Error extracting token info: %s", e)
         
         return TokenInfo(
-            token=token,  # Will be masked in __post_init__
-            is_valid=info["token_valid"],
-            user_id=info["user_id"],
-            username=info["username"],
-            discriminator=info["discriminator"],
-            verified=info["verified"],
-            mfa_enabled=info["mfa_enabled"],
-            error_message=info["error"]
+            token=token, is_valid=False, user_id=user_id, error_message=error_message
         )
     
-    def _extract_user_id_from_token(self, token: str) -> Optional[str]:
-        try:
-            if '.' in token:
-                parts = token.split('.')
-                if len(parts) >= 1:
-                    user_id_b64 = parts[0]
-                    padding = 4 - (len(user_id_b64) % 4)
-                    if padding != 4:
-                        user_id_b64 += '=' * padding
-                    
-                    try:
-                        user_id_bytes = base64.b64decode(user_id_b64)
-                        user_id = user_id_bytes.decode('utf-8')
-                        return user_id
-                    except Exception:
-                        pass
+    async def validate_many(
+        self, tokens: Iterable[str], concurrency: int = 20
+    ) -> List[TokenInfo]:
+        semaphore = asyncio.Semaphore(concurrency)
         
-        except Exception:
-            pass
+        async def check(token: str) -> TokenInfo:
+            # Malformed tokens never reach the network, so they skip the semaphore
+            if not self._validate_format_sync(token):
+                return await self.create_token_info(token)
+            async with semaphore:
+                return await self.create_token_info(token)
         
-        return None
+        return await asyncio.gather(*(check(token) for token in tokens))
     
-    async def _get_user_data(self, token: str) -> Optional[Dict[str, any]]:
-        try:
-            headers = {
-                "Authorization": token,
-                "Content-Type": "application/json",
-                "User-Agent": "DiscordBot (https://github.com/discord-selfbot, 1.0.0)"
-            }
-            
-            async with aiohttp.ClientSession(timeout=aiohttp.ClientTimeout(total=self.timeout)) as session:
-                async with session.get(self.user_endpoint, headers=headers) as response:
-                    if response.status == 200:
-                        return await response.json()
-                    else:
-                        return None
-        
-        except Exception as e:
-            self.logger.error(f"Error getting user data: {e}")
+    def _extract_user_id_from_token(self, token: str) -> Optional[str]:
+        # The first segment is the user id, base64url-encoded without padding
+        first, dot, _ = token.partition('.')
+        if not dot:
             return None
+        
+        return _decode_user_id(first)
+    
+    async def _fetch_user(self, token: str) -> Tuple[int, Optional[Dict[str, any]]]:
+        """GET /users/@me once, returning (status, user data or None)."""
+        key = _token_key(token)
+        cached = self._cache_get(self._api_cache, key)
+        if cached is not _MISS:
+            return cached
+        
+        headers = {"Authorization": token, **_BASE_HEADERS}
+        session = await self._get_session()
+        async with session.get(self.user_endpoint, headers=headers) as response:
+            status = response.status
+            if status == 200:
+                try:
+                    user_data = orjson.loads(await response.read())
+                except orjson.JSONDecodeError:
+                    return status, None
+                result = (status, user_data)
+                self._cache_put(self._api_cache, key, result, _API_CACHE_TTL)
+            else:
+                result = (status, None)
+                if status == 401:
+                    self._cache_put(self._api_cache, key, result, _API_NEGATIVE_TTL)
+            return result
+
+
+# Only used for format checks, which never open a session
+@lru_cache(maxsize=1)
+def _get_validator() -> TokenValidator:
+    return TokenValidator()
 
 
 async def validate_token_format(token: str) -> bool:
-    validator = TokenValidator()
-    return await validator.validate_format(token)
+    return await _get_validator().validate_format(token)
 
 
-async def validate_token_api(token: str, timeout: float = 10.0) -> bool:
-    validator = TokenValidator(timeout=timeout)
-    return await validator.validate_api(token)
+async def validate_token_api(
+    token: str, timeout: float = 10.0, validator: Optional[TokenValidator] = None
+) -> bool:
+    # A caller-owned validator keeps its pooled session; otherwise use a
+    # short-lived one so no session outlives this call or its event loop
+    if validator is not None:
+        return await validator.validate_api(token)
+    async with TokenValidator(timeout=timeout) as owned:
+        return await owned.validate_api(token)
 
 
-async def get_token_info(token: str, timeout: float = 10.0) -> TokenInfo:
-    validator = TokenValidator(timeout=timeout)
-    return await validator.create_token_info(token)
+async def get_token_info(
+    token: str, timeout: float = 10.0, validator: Optional[TokenValidator] = None
+) -> TokenInfo:
+    if validator is not None:
+        return await validator.create_token_info(token)
+    async with TokenValidator(timeout=timeout) as owned:
+        return await owned.create_token_info(token)
 
 
 async def main() -> None:
@@ -207,30 +341,29 @@ async def main() -> None:
     print("🔍 Validating Discord token...")
     print("=" * 50)
     
-    try:
-        validator = TokenValidator()
-        
-        info = await validator.extract_info(token)
+    async with TokenValidator() as validator:
+        try:
+            info = await validator.extract_info(token)
         
-        print(f"Format Valid: {'✅' if info['format_valid'] else '❌'}")
-        print(f"API Valid: {'✅' if info['api_valid'] else '❌'}")
-        print(f"Overall Valid: {'✅' if info['token_valid'] else '❌'}")
+            print(f"Format Valid: {'✅' if info['format_valid'] else '❌'}")
+            print(f"API Valid: {'✅' if info['api_valid'] else '❌'}")
+            print(f"Overall Valid: {'✅' if info['token_valid'] else '❌'}")
         
-        if info['user_id']:
-            print(f"User ID: {info['user_id']}")
-        if info['username']:
-            print(f"Username: {info['username']}#{info['discriminator']}")
-        if info['verified'] is not None:
-            print(f"Verified: {'✅' if info['verified'] else '❌'}")
-        if info['mfa_enabled'] is not None:
-            print(f"MFA Enabled: {'✅' if info['mfa_enabled'] else '❌'}")
+            if info['user_id']:
+                print(f"User ID: {info['user_id']}")
+            if info['username']:
+                print(f"Username: {info['username']}#{info['discriminator']}")
+            if info['verified'] is not None:
+                print(f"Verified: {'✅' if info['verified'] else '❌'}")
+            if info['mfa_enabled'] is not None:
+                print(f"MFA Enabled: {'✅' if info['mfa_enabled'] else '❌'}")
         
-        if info['error']:
-            print(f"Error: {info['error']}")
+            if info['error']:
+                print(f"Error: {info['error']}")
     
-    except Exception as e:
-        print(f"❌ Validation failed: {e}")
-        sys.exit(1)
+        except Exception as e:
+            print(f"❌ Validation failed: {e}")
+            sys.exit(1)
 
 
 if __name__ == "__main__":
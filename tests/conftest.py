@@ -7,19 +7,29 @@ from typing import Dict, Any
 
 import discord
 
-from src.discord_selfbot.config.settings import Settings
-from src.discord_selfbot.core.types import CommandConfig, CommandExecutionResult
-from src.discord_selfbot.services.command_registry import CommandRegistry
-from src.discord_selfbot.services.bot_stats import BotStatsService
-from src.discord_selfbot.services.discord_service import DiscordService
+from config.settings import Settings
+from core.types import CommandConfig, CommandExecutionResult
+from services.command_registry import CommandRegistry
+from services.bot_stats import BotStatsService
+from services.discord_service import DiscordService
 
 
 @pytest.fixture(scope="session")
 def event_loop():
     """Create an instance of the default event loop for the test session."""
+    # Prefer uvloop when it is installed; it is an optional performance extra.
+    # The previous policy is restored on teardown.
+    previous_policy = asyncio.get_event_loop_policy()
+    try:
+        import uvloop
+
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    except ImportError:
+        pass
     loop = asyncio.get_event_loop_policy().new_event_loop()
     yield loop
     loop.close()
+    asyncio.set_event_loop_policy(previous_policy)
 
 
 @pytest.fixture
@@ -42,7 +52,7 @@ def test_settings() -> Settings:
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mock_discord_client():
     """Create a mock Discord client for testing."""
     client = Mock(spec=discord.Client)
@@ -65,10 +75,10 @@ def mock_discord_client():
     return client
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mock_discord_message():
     """Create a mock Discord message for testing."""
-    message = Mock(spec=discord.Message)
+    message = Mock(spec_set=discord.Message)
     message.id = 987654321
     message.content = ".test"
     message.author = Mock()
@@ -84,6 +94,18 @@ def mock_discord_message():
     return message
 
 
+@pytest.fixture(autouse=True)
+def _reset_session_mocks(mock_discord_client, mock_discord_message):
+    """Clear call history on the session-scoped mocks after each test.
+
+    reset_mock() does not undo attribute assignments; tests that replace an
+    attribute on these mocks must use monkeypatch so it is restored.
+    """
+    yield
+    mock_discord_client.reset_mock()
+    mock_discord_message.reset_mock()
+
+
 @pytest.fixture
 async def command_registry():
     """Create a command registry for testing."""
@@ -148,13 +170,13 @@ def mock_command():
     return command
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def test_token_valid():
     """Valid test token format."""
     return "mfa.test_token_" + "x" * 70
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def test_token_invalid():
     """Invalid test token format."""
     return "invalid_token"
@@ -202,9 +224,8 @@ class MockCommand:
         return self._config
 
 
-@pytest.fixture
-def mock_commands():
-    """Create a list of mock commands for testing."""
+def _build_mock_commands():
+    """Build the standard set of mock commands."""
     return [
         MockCommand("ping", ".ping"),
         MockCommand("help", ".help"),
@@ -212,6 +233,12 @@ def mock_commands():
     ]
 
 
+@pytest.fixture
+def mock_commands():
+    """Create a list of mock commands for testing."""
+    return _build_mock_commands()
+
+
 # Async fixtures
 @pytest_asyncio.fixture
 async def async_command_registry():
@@ -229,6 +256,19 @@ async def populated_command_registry(async_command_registry, mock_commands):
     return async_command_registry
 
 
+@pytest_asyncio.fixture(scope="module")
+async def registry_with_mocks():
+    """Command registry with the standard mock commands, registered once per module.
+
+    Shared between tests; treat it as read-only.
+    """
+    registry = CommandRegistry()
+    for command in _build_mock_commands():
+        await registry.register(command)
+    yield registry
+    await registry.clear()
+
+
 # Test data fixtures
 @pytest.fixture
 def test_user_data():
@@ -260,6 +300,26 @@ def test_metrics_data():
     }
 
 
+@pytest.fixture(scope="session")
+def create_test_message():
+    """Factory for test Discord messages.
+
+    The discord.Message attribute list is resolved once per session; each call
+    still returns a fresh mock with its own ``author`` and ``edit``.
+    """
+    message_spec = dir(discord.Message)
+
+    def factory(content: str = ".test", user_id: int = 123456789):
+        message = Mock(spec=message_spec)
+        message.content = content
+        message.author = Mock()
+        message.author.id = user_id
+        message.edit = AsyncMock()
+        return message
+
+    return factory
+
+
 # Utility functions for tests
 def assert_command_result(result: CommandExecutionResult, success: bool = True):
     """Assert command result properties."""
@@ -273,14 +333,6 @@ def assert_command_result(result: CommandExecutionResult, success: bool = True):
         assert result.error is not None
 
 
-def create_test_message(content: str = ".test", user_id: int = 123456789):
-    """Create a test Discord message."""
-    message = Mock(spec=discord.Message)
-    message.content = content
-    message.author = Mock()
-    message.author.id = user_id
-    message.edit = AsyncMock()
-    return message
 
 
 # Markers for different test types
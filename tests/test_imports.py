@@ -0,0 +1,18 @@
+"""Smoke test that the core modules import cleanly."""
+
+import importlib
+
+import pytest
+
+MODULES = [
+    "core.exceptions",
+    "core.interfaces",
+    "core.types",
+    "config.logging",
+    "utils.validators",
+]
+
+
+@pytest.mark.parametrize("module", MODULES)
+def test_import(module):
+    importlib.import_module(module)
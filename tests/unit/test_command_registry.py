@@ -0,0 +1,29 @@
+import pytest
+
+from tests.conftest import MockCommand
+
+
+class TestCommandRegistry:
+    """Test cases for CommandRegistry."""
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        "name,category", [("ping", "Utility"), ("joke", "Fun"), ("custom", "Other")]
+    )
+    async def test_registry_get_category(self, command_registry, name, category):
+        """Test per-command categorization on the registry."""
+        await command_registry.register(MockCommand(name, f".{name}"))
+        assert command_registry.get_category(name) == category
+
+    def test_registry_get_categorized(self, registry_with_mocks):
+        """Test command categorization."""
+        categorized = registry_with_mocks.get_categorized()
+
+        assert "Utility" in categorized
+        assert len(categorized["Utility"]) == 2  # ping and help
+        assert any(cmd.name == "ping" for cmd in categorized["Utility"])
+        assert any(cmd.name == "help" for cmd in categorized["Utility"])
+
+        # Test command should be in Other category
+        assert "Other" in categorized
+        assert any(cmd.name == "test" for cmd in categorized["Other"])
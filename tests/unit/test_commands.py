@@ -1,14 +1,13 @@
 
 import pytest
-import pytest_asyncio
 from unittest.mock import Mock, AsyncMock, patch
 import discord
 
-from src.discord_selfbot.commands.ping_command import PingCommand
-from src.discord_selfbot.commands.help_command import HelpCommand
-from src.discord_selfbot.core.types import CommandConfig, CommandExecutionResult
-from src.discord_selfbot.core.exceptions import CommandError
-from tests.conftest import assert_command_result, create_test_message
+from commands.ping_command import PingCommand
+from commands.help_command import HelpCommand
+from core.types import CommandConfig, CommandExecutionResult
+from core.exceptions import CommandError
+from tests.conftest import assert_command_result
 
 
 class TestPingCommand:
@@ -27,8 +26,8 @@ class TestPingCommand:
         assert ping_command.config.enabled is True
         assert ping_command.config.cooldown == 1000
     
-    @pytest_asyncio.fixture
-    async def test_ping_command_execute_success(self, ping_command):
+    @pytest.mark.asyncio
+    async def test_ping_command_execute_success(self, ping_command, create_test_message):
         """Test successful ping command execution."""
         message = create_test_message(".ping")
         
@@ -44,11 +43,11 @@ class TestPingCommand:
         # Verify message was edited
         message.edit.assert_called_once()
     
-    @pytest_asyncio.fixture
-    async def test_ping_command_websocket_error(self, ping_command):
+    @pytest.mark.asyncio
+    async def test_ping_command_websocket_error(self, ping_command, create_test_message, monkeypatch):
         """Test ping command with WebSocket error."""
-        # Remove WebSocket from client
-        ping_command.client.ws = None
+        # Remove WebSocket from the shared client for this test only
+        monkeypatch.setattr(ping_command.client, "ws", None)
         message = create_test_message(".ping")
         
         with pytest.raises(CommandError) as exc_info:
@@ -57,20 +56,27 @@ class TestPingCommand:
         assert exc_info.value.error_code == "NO_WEBSOCKET"
         assert "WebSocket connection not available" in str(exc_info.value)
     
-    def test_ping_command_assess_connection_quality(self, ping_command):
+    @pytest.mark.parametrize(
+        "latency,quality",
+        [(25.0, "excellent"), (75.0, "good"), (150.0, "fair"), (250.0, "poor")],
+    )
+    def test_ping_command_assess_connection_quality(self, ping_command, latency, quality):
         """Test connection quality assessment."""
-        assert ping_command._assess_connection_quality(25.0) == "excellent"
-        assert ping_command._assess_connection_quality(75.0) == "good"
-        assert ping_command._assess_connection_quality(150.0) == "fair"
-        assert ping_command._assess_connection_quality(250.0) == "poor"
+        assert ping_command._assess_connection_quality(latency) == quality
     
-    def test_ping_command_get_quality_emoji(self, ping_command):
+    @pytest.mark.parametrize(
+        "quality,emoji",
+        [
+            ("excellent", "🟢"),
+            ("good", "🟡"),
+            ("fair", "🟠"),
+            ("poor", "🔴"),
+            ("unknown", "⚪"),
+        ],
+    )
+    def test_ping_command_get_quality_emoji(self, ping_command, quality, emoji):
         """Test quality emoji selection."""
-        assert ping_command._get_quality_emoji("excellent") == "🟢"
-        assert ping_command._get_quality_emoji("good") == "🟡"
-        assert ping_command._get_quality_emoji("fair") == "🟠"
-        assert ping_command._get_quality_emoji("poor") == "🔴"
-        assert ping_command._get_quality_emoji("unknown") == "⚪"
+        assert ping_command._get_quality_emoji(quality) == emoji
     
     def test_ping_command_format_response(self, ping_command):
         """Test response formatting."""
@@ -95,9 +101,9 @@ class TestPingCommand:
         assert stats["client_ready"] is True
         assert stats["websocket_available"] is True
     
-    def test_ping_command_get_latency_stats_no_websocket(self, ping_command):
+    def test_ping_command_get_latency_stats_no_websocket(self, ping_command, monkeypatch):
         """Test latency statistics with no WebSocket."""
-        ping_command.client.ws = None
+        monkeypatch.setattr(ping_command.client, "ws", None)
         stats = ping_command.get_latency_stats()
         
         assert stats is not None
@@ -114,6 +120,11 @@ class TestHelpCommand:
         """Create a HelpCommand instance for testing."""
         return HelpCommand(command_registry)
     
+    @pytest.fixture
+    def populated_help_command(self, registry_with_mocks):
+        """Create a HelpCommand backed by the shared pre-registered registry."""
+        return HelpCommand(registry_with_mocks)
+    
     def test_help_command_properties(self, help_command):
         """Test HelpCommand basic properties."""
         assert help_command.name == "help"
@@ -122,8 +133,8 @@ class TestHelpCommand:
         assert help_command.config.enabled is True
         assert help_command.config.cooldown == 2000
     
-    @pytest_asyncio.fixture
-    async def test_help_command_execute_no_commands(self, help_command):
+    @pytest.mark.asyncio
+    async def test_help_command_execute_no_commands(self, help_command, create_test_message):
         """Test help command with no registered commands."""
         message = create_test_message(".help")
         
@@ -133,15 +144,11 @@ class TestHelpCommand:
         assert "No commands available" in result.response
         message.edit.assert_called_once()
     
-    @pytest_asyncio.fixture
-    async def test_help_command_execute_with_commands(self, help_command, mock_commands):
+    @pytest.mark.asyncio
+    async def test_help_command_execute_with_commands(self, populated_help_command, create_test_message):
         """Test help command with registered commands."""
-        # Register mock commands
-        for command in mock_commands:
-            await help_command.command_registry.register(command)
-        
         message = create_test_message(".help")
-        result = await help_command.execute(message)
+        result = await populated_help_command.execute(message)
         
         assert_command_result(result, success=True)
         assert "Discord Self-Bot Commands" in result.response
@@ -151,15 +158,11 @@ class TestHelpCommand:
         assert result.metadata["total_commands"] == 3
         message.edit.assert_called_once()
     
-    @pytest_asyncio.fixture
-    async def test_help_command_detailed_help(self, help_command, mock_commands):
+    @pytest.mark.asyncio
+    async def test_help_command_detailed_help(self, populated_help_command, create_test_message):
         """Test detailed help for specific command."""
-        # Register mock commands
-        for command in mock_commands:
-            await help_command.command_registry.register(command)
-        
         message = create_test_message(".help ping")
-        result = await help_command.execute(message)
+        result = await populated_help_command.execute(message)
         
         assert_command_result(result, success=True)
         assert "Help for `.ping`" in result.response
@@ -168,8 +171,8 @@ class TestHelpCommand:
         assert result.metadata["specific_command"] == "ping"
         message.edit.assert_called_once()
     
-    @pytest_asyncio.fixture
-    async def test_help_command_detailed_help_not_found(self, help_command):
+    @pytest.mark.asyncio
+    async def test_help_command_detailed_help_not_found(self, help_command, create_test_message):
         """Test detailed help for non-existent command."""
         message = create_test_message(".help nonexistent")
         result = await help_command.execute(message)
@@ -190,81 +193,52 @@ class TestHelpCommand:
         args = help_command._parse_arguments(".help ping test")
         assert args == ["ping", "test"]
     
-    def test_help_command_categorize_single_command(self, help_command):
-        """Test command categorization."""
-        ping_command = Mock()
-        ping_command.name = "ping"
-        assert help_command._categorize_single_command(ping_command) == "Utility"
-        
-        fun_command = Mock()
-        fun_command.name = "joke"
-        assert help_command._categorize_single_command(fun_command) == "Fun"
-        
-        other_command = Mock()
-        other_command.name = "custom"
-        assert help_command._categorize_single_command(other_command) == "Other"
-    
-    def test_help_command_get_category_emoji(self, help_command):
+    @pytest.mark.parametrize(
+        "category,emoji",
+        [
+            ("Utility", "🔧"),
+            ("Fun", "🎉"),
+            ("Information", "ℹ️"),
+            ("Moderation", "🛡️"),
+            ("Other", "📦"),
+            ("Unknown", "📦"),
+        ],
+    )
+    def test_help_command_get_category_emoji(self, help_command, category, emoji):
         """Test category emoji selection."""
-        assert help_command._get_category_emoji("Utility") == "🔧"
-        assert help_command._get_category_emoji("Fun") == "🎉"
-        assert help_command._get_category_emoji("Information") == "ℹ️"
-        assert help_command._get_category_emoji("Moderation") == "🛡️"
-        assert help_command._get_category_emoji("Other") == "📦"
-        assert help_command._get_category_emoji("Unknown") == "📦"
+        assert help_command._get_category_emoji(category) == emoji
     
-    def test_help_command_get_status_emoji(self, help_command):
+    @pytest.mark.parametrize("enabled,emoji", [(True, "✅"), (False, "❌")])
+    def test_help_command_get_status_emoji(self, help_command, enabled, emoji):
         """Test status emoji selection."""
-        enabled_command = Mock()
-        enabled_command.get_config.return_value = CommandConfig(enabled=True)
-        assert help_command._get_status_emoji(enabled_command) == "✅"
-        
-        disabled_command = Mock()
-        disabled_command.get_config.return_value = CommandConfig(enabled=False)
-        assert help_command._get_status_emoji(disabled_command) == "❌"
+        command = Mock()
+        command.get_config.return_value = CommandConfig(enabled=enabled)
+        assert help_command._get_status_emoji(command) == emoji
     
-    @pytest_asyncio.fixture
-    async def test_help_command_find_command(self, help_command, mock_commands):
+    @pytest.mark.asyncio
+    async def test_help_command_find_command(self, populated_help_command):
         """Test command finding by name or trigger."""
-        # Register mock commands
-        for command in mock_commands:
-            await help_command.command_registry.register(command)
-        
         # Find by trigger
-        command = await help_command._find_command(".ping")
+        command = await populated_help_command._find_command(".ping")
         assert command is not None
         assert command.name == "ping"
         
         # Find by name
-        command = await help_command._find_command("ping")
+        command = await populated_help_command._find_command("ping")
         assert command is not None
         assert command.name == "ping"
         
         # Find non-existent
-        command = await help_command._find_command("nonexistent")
+        command = await populated_help_command._find_command("nonexistent")
         assert command is None
-    
-    @pytest_asyncio.fixture
-    async def test_help_command_categorize_commands(self, help_command, mock_commands):
-        """Test command categorization."""
-        categorized = await help_command._categorize_commands(mock_commands)
-        
-        assert "Utility" in categorized
-        assert len(categorized["Utility"]) == 2  # ping and help
-        assert any(cmd.name == "ping" for cmd in categorized["Utility"])
-        assert any(cmd.name == "help" for cmd in categorized["Utility"])
-        
-        # Test command should be in Other category
-        assert "Other" in categorized
-        assert any(cmd.name == "test" for cmd in categorized["Other"])
 
 
 # Integration tests for command interactions
 class TestCommandIntegration:
     """Integration tests for command interactions."""
     
-    @pytest_asyncio.fixture
-    async def test_commands_with_registry(self, mock_discord_client, command_registry):
+    @pytest.mark.asyncio
+    async def test_commands_with_registry(self, mock_discord_client, command_registry, create_test_message):
         """Test commands working with registry."""
         # Create commands
         ping_command = PingCommand(mock_discord_client)
@@ -0,0 +1,70 @@
+import pytest
+from unittest.mock import ANY, AsyncMock
+
+from tests.conftest import MockCommand
+
+
+class TestDiscordServiceDispatch:
+    """Test cases for message-to-command dispatch in DiscordService."""
+
+    @pytest.mark.asyncio
+    async def test_find_matching_command_by_trigger(self, discord_service):
+        """Test that a message starting with a trigger resolves to its command."""
+        ping = MockCommand("ping", ".ping")
+        await discord_service.command_registry.register(ping)
+
+        assert discord_service._find_matching_command(".ping") is ping
+        assert discord_service._find_matching_command(".ping extra") is ping
+        assert discord_service._find_matching_command("hello") is None
+
+    @pytest.mark.asyncio
+    async def test_find_matching_command_prefers_earliest_registered(self, discord_service):
+        """Test that the earliest registered trigger wins when several prefix the message."""
+        help_command = MockCommand("help", ".help")
+        short_command = MockCommand("h", ".h")
+        await discord_service.command_registry.register(help_command)
+        await discord_service.command_registry.register(short_command)
+
+        assert discord_service._find_matching_command(".h") is short_command
+        assert discord_service._find_matching_command(".help") is help_command
+        assert discord_service._find_matching_command(".help ping") is help_command
+
+    @pytest.mark.asyncio
+    async def test_find_matching_command_reads_enabled_live(self, discord_service):
+        """Test that enabling a command after registration makes it dispatchable."""
+        afk = MockCommand("afk", ".afk", enabled=False)
+        await discord_service.command_registry.register(afk)
+
+        assert discord_service._find_matching_command(".afk") is None
+
+        afk.get_config().enabled = True
+        assert discord_service._find_matching_command(".afk") is afk
+
+    @pytest.mark.asyncio
+    async def test_handle_message_executes_command(
+        self, discord_service, create_test_message, monkeypatch
+    ):
+        """Test that a matching message runs the command and records stats."""
+        ping = MockCommand("ping", ".ping")
+        await discord_service.command_registry.register(ping)
+        record = AsyncMock()
+        monkeypatch.setattr(discord_service.bot_stats, "record_message_and_command", record)
+        discord_service._self_id = 123456789
+
+        await discord_service._handle_message(create_test_message(".ping"))
+
+        assert ping.execute_count == 1
+        record.assert_awaited_once_with("ping", ANY, True)
+
+    @pytest.mark.asyncio
+    async def test_handle_message_without_command(
+        self, discord_service, create_test_message, monkeypatch
+    ):
+        """Test that a non-command message is only counted."""
+        record = AsyncMock()
+        monkeypatch.setattr(discord_service.bot_stats, "increment_messages_processed", record)
+        discord_service._self_id = 123456789
+
+        await discord_service._handle_message(create_test_message("hello"))
+
+        record.assert_awaited_once_with()
@@ -4,17 +4,69 @@ Standalone Discord token validator utility.
 
 This script validates Discord tokens without importing the full bot framework,
 avoiding circular import issues.
+
+Several tokens can be passed at once and are validated concurrently. For
+large batches the script also runs unmodified under PyPy
+(``pypy3 validate_token.py ...``), whose JIT speeds up the pure-Python
+format and user ID checks once they have warmed up.
 """
 
 import asyncio
 import base64
 import json
-import re
+import string
 import sys
-from typing import Dict, Any, Optional
+from functools import lru_cache
+from typing import Dict, Any, List, Optional
 
 import aiohttp
 
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:  # pragma: no cover - orjson is optional for this script
+    _json_loads = json.loads
+
+# Discord token pattern: base64.base64.base64 over the urlsafe alphabet.
+# bytes.translate deletes every allowed byte, so only the two separators
+# should survive a well-formed token.
+_TOKEN_ALPHABET = (string.ascii_letters + string.digits + '_-').encode('ascii')
+
+# users/@me fields reported by the CLI; the rest of the payload is dropped
+_USER_FIELDS = ('id', 'username', 'discriminator', 'verified', 'mfa_enabled', 'email')
+
+# Sent on every request through the pooled session; only Authorization varies
+_BASE_HEADERS = {
+    'Content-Type': 'application/json',
+    'User-Agent': 'DiscordBot (https://github.com/example/bot, 1.0.0)'
+}
+
+
+def _token_format_valid(token: str) -> bool:
+    """Check token structure and alphabet."""
+    parts = token.split('.')
+    if len(parts) != 3:
+        return False
+
+    head, middle, tail = parts
+    if not (23 <= len(head) <= 28 and len(middle) == 6 and len(tail) >= 27):
+        return False
+
+    raw = token.encode('ascii', 'ignore')
+    return len(raw) == len(token) and raw.translate(None, _TOKEN_ALPHABET) == b'..'
+
+
+# Keyed on the user ID segment only, so the cache never holds a full token
+@lru_cache(maxsize=1024)
+def _decode_user_id(token_head: str) -> Optional[str]:
+    """Decode the base64 user ID segment (urlsafe alphabet) of a token."""
+    try:
+        part = token_head.encode('ascii')
+        part += b'=' * (-len(part) % 4)
+        return base64.urlsafe_b64decode(part).decode('ascii')
+    except Exception:
+        return None
+
 
 class TokenValidator:
     """Standalone Discord token validator."""
@@ -24,63 +76,61 @@ class TokenValidator:
         self.session: Optional[aiohttp.ClientSession] = None
     
     async def __aenter__(self):
-        self.session = aiohttp.ClientSession(timeout=aiohttp.ClientTimeout(total=self.timeout))
+        if self.session is None or self.session.closed:
+            self.session = self._new_session()
         return self
     
     async def __aexit__(self, exc_type, exc_val, exc_tb):
-        if self.session:
+        await self.aclose()
+    
+    def _new_session(self) -> aiohttp.ClientSession:
+        """Create a pooled session with the shared request headers."""
+        return aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(
+                limit=100, ttl_dns_cache=300, keepalive_timeout=30
+            ),
+            timeout=aiohttp.ClientTimeout(total=self.timeout),
+            headers=_BASE_HEADERS,
+        )
+    
+    async def aclose(self) -> None:
+        """Close the pooled session if one was opened."""
+        if self.session is not None and not self.session.closed:
             await self.session.close()
+        self.session = None
     
     def validate_format(self, token: str) -> bool:
         """Validate Discord token format."""
         if not token or not isinstance(token, str):
             return False
         
-        # Discord token pattern: base64.base64.base64
-        pattern = r'^[A-Za-z0-9_-]{23,28}\.[A-Za-z0-9_-]{6}\.[A-Za-z0-9_-]{27,}$'
-        return bool(re.match(pattern, token))
+        return _token_format_valid(token)
     
     def extract_user_id(self, token: str) -> Optional[str]:
         """Extract user ID from Discord token."""
         if not self.validate_format(token):
             return None
-        
-        try:
-            # First part of token contains base64-encoded user ID
-            user_id_part = token.split('.')[0]
-            # Add padding if needed
-            padding = 4 - (len(user_id_part) % 4)
-            if padding != 4:
-                user_id_part += '=' * padding
-            
-            decoded = base64.b64decode(user_id_part)
-            return decoded.decode('utf-8')
-        except Exception:
-            return None
+        return _decode_user_id(token.split('.', 1)[0])
     
     async def validate_api(self, token: str) -> Dict[str, Any]:
         """Validate token against Discord API."""
-        if not self.session:
-            async with aiohttp.ClientSession(timeout=aiohttp.ClientTimeout(total=self.timeout)) as session:
+        if self.session is None or self.session.closed:
+            # Not entered as a context manager: use a throwaway session
+            async with self._new_session() as session:
                 return await self._make_api_request(session, token)
-        else:
-            return await self._make_api_request(self.session, token)
+        return await self._make_api_request(self.session, token)
     
     async def _make_api_request(self, session: aiohttp.ClientSession, token: str) -> Dict[str, Any]:
         """Make API request to validate token."""
-        headers = {
-            'Authorization': token,
-            'Content-Type': 'application/json',
-            'User-Agent': 'DiscordBot (https://github.com/example/bot, 1.0.0)'
-        }
+        headers = {'Authorization': token}
         
         try:
             async with session.get('https://discord.com/api/v10/users/@me', headers=headers) as response:
                 if response.status == 200:
-                    data = await response.json()
+                    data = _json_loads(await response.read())
                     return {
                         'valid': True,
-                        'user_data': data,
+                        'user_data': {key: data[key] for key in _USER_FIELDS if key in data},
                         'status_code': response.status,
                         'error': None
                     }
@@ -109,76 +159,99 @@ class TokenValidator:
     
     async def validate_comprehensive(self, token: str) -> Dict[str, Any]:
         """Perform comprehensive token validation."""
-        result = {
-            'token': token[:10] + "..." if len(token) > 10 else token,
-            'format_valid': False,
-            'api_valid': False,
-            'user_id': None,
-            'user_data': None,
-            'error': None
-        }
-        
-        # Check format
-        result['format_valid'] = self.validate_format(token)
-        if not result['format_valid']:
-            result['error'] = "Invalid token format"
-            return result
+        masked = token[:10] + "..." if len(token) > 10 else token
         
-        # Extract user ID
-        result['user_id'] = self.extract_user_id(token)
+        # Check format; malformed tokens never reach the API
+        if not self.validate_format(token):
+            return {
+                'token': masked,
+                'format_valid': False,
+                'api_valid': False,
+                'user_id': None,
+                'user_data': None,
+                'error': "Invalid token format"
+            }
         
         # Check API
         api_result = await self.validate_api(token)
-        result['api_valid'] = api_result['valid']
-        result['user_data'] = api_result['user_data']
+        return {
+            'token': masked,
+            'format_valid': True,
+            'api_valid': api_result['valid'],
+            # Format is already known to be valid, so skip extract_user_id's re-check
+            'user_id': _decode_user_id(token.split('.', 1)[0]),
+            'user_data': api_result['user_data'],
+            'error': api_result['error']
+        }
+    
+    async def validate_many(self, tokens: List[str], concurrency: int = 32) -> List[Dict[str, Any]]:
+        """Run validate_comprehensive over many tokens with bounded concurrency.
+        
+        Results are returned in the same order as ``tokens``. Outside
+        ``async with`` a pooled session is opened for the batch and closed after.
+        """
+        if self.session is None or self.session.closed:
+            async with self:
+                return await self.validate_many(tokens, concurrency)
+        
+        semaphore = asyncio.Semaphore(concurrency)
         
-        if not result['api_valid']:
-            result['error'] = api_result['error']
+        async def _one(token: str) -> Dict[str, Any]:
+            async with semaphore:
+                return await self.validate_comprehensive(token)
         
-        return result
+        return await asyncio.gather(*[_one(token) for token in tokens])
+
+
+def _print_result(result: Dict[str, Any]) -> None:
+    """Print a single validate_comprehensive result."""
+    print(f"Token: {result['token']}")
+    print(f"Format Valid: {'✅' if result['format_valid'] else '❌'}")
+    print(f"API Valid: {'✅' if result['api_valid'] else '❌'}")
+    
+    if result['user_id']:
+        print(f"User ID: {result['user_id']}")
+    
+    if result['user_data']:
+        user = result['user_data']
+        print(f"Username: {user.get('username', 'Unknown')}#{user.get('discriminator', '0000')}")
+        print(f"ID: {user.get('id', 'Unknown')}")
+        print(f"Verified: {'✅' if user.get('verified', False) else '❌'}")
+        print(f"MFA Enabled: {'✅' if user.get('mfa_enabled', False) else '❌'}")
+        print(f"Email: {user.get('email', 'Not provided')}")
+    
+    if result['error']:
+        print(f"Error: {result['error']}")
 
 
 async def main():
     """Main function for command-line usage."""
     if len(sys.argv) < 2:
-        print("Usage: python validate_token.py <discord_token>")
+        print("Usage: python validate_token.py <discord_token> [<discord_token> ...]")
         print("Example: python validate_token.py ")
         sys.exit(1)
     
-    token = sys.argv[1]
+    tokens = sys.argv[1:]
     
-    print("🔍 Validating Discord token...")
+    print("🔍 Validating Discord token..." if len(tokens) == 1 else f"🔍 Validating {len(tokens)} Discord tokens...")
     print("=" * 50)
     
     try:
         async with TokenValidator() as validator:
-            result = await validator.validate_comprehensive(token)
+            results = await validator.validate_many(tokens)
             
             # Display results
-            print(f"Token: {result['token']}")
-            print(f"Format Valid: {'✅' if result['format_valid'] else '❌'}")
-            print(f"API Valid: {'✅' if result['api_valid'] else '❌'}")
-            
-            if result['user_id']:
-                print(f"User ID: {result['user_id']}")
-            
-            if result['user_data']:
-                user = result['user_data']
-                print(f"Username: {user.get('username', 'Unknown')}#{user.get('discriminator', '0000')}")
-                print(f"ID: {user.get('id', 'Unknown')}")
-                print(f"Verified: {'✅' if user.get('verified', False) else '❌'}")
-                print(f"MFA Enabled: {'✅' if user.get('mfa_enabled', False) else '❌'}")
-                print(f"Email: {user.get('email', 'Not provided')}")
-            
-            if result['error']:
-                print(f"Error: {result['error']}")
+            for index, result in enumerate(results):
+                if index:
+                    print("-" * 50)
+                _print_result(result)
             
             # Exit with appropriate code
-            if result['format_valid'] and result['api_valid']:
-                print("\n✅ Token is valid!")
+            if all(r['format_valid'] and r['api_valid'] for r in results):
+                print("\n✅ Token is valid!" if len(results) == 1 else "\n✅ All tokens are valid!")
                 sys.exit(0)
             else:
-                print("\n❌ Token is invalid!")
+                print("\n❌ Token is invalid!" if len(results) == 1 else "\n❌ Some tokens are invalid!")
                 sys.exit(1)
                 
     except Exception as e:
@@ -187,4 +260,10 @@ async def main():
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    # uvloop is optional (the bot's "performance" extra); not available on Windows
+    try:
+        import uvloop
+    except ImportError:
+        asyncio.run(main())
+    else:
+        uvloop.run(main())